@@ -23,12 +23,17 @@ from .commands.pm import (
 from .commands.setup import setup_command, uninstall_command, update_command
 from .utils.console import print_error, strip_emojis
 
+# Emoji handling only differs on the Windows console
+_IS_WIN32 = sys.platform == "win32"
 
-def safe_echo(message: str, err: bool = False) -> None:
-    """Echo with emoji handling for Windows."""
-    if sys.platform == "win32":
-        message = strip_emojis(message)
-    click.echo(message, err=err)
+
+def _safe_echo_win32(message: str, err: bool = False) -> None:
+    """Echo with emojis replaced for the Windows console."""
+    click.echo(strip_emojis(message), err=err)
+
+
+# Echo with emoji handling for Windows, chosen once like console.safe_print
+safe_echo = _safe_echo_win32 if _IS_WIN32 else click.echo
 
 
 @click.group()
@@ -112,10 +117,11 @@ def init() -> None:
 
 
 @cli.command("list")
-def list_prds() -> None:
+@click.option("--json", "as_json", is_flag=True, help="Print the PRDs as JSON")
+def list_prds(as_json: bool) -> None:
     """List all PRDs (shortcut for /pm:prd-list)."""
     try:
-        list_command()
+        list_command(as_json=as_json)
     except Exception as exc:
         safe_echo(f"❌ List failed: {exc}", err=True)
         sys.exit(1)
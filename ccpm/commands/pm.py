@@ -1,8 +1,9 @@
 """PM workflow commands."""
 
+import json
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from ..utils.claude import find_claude_cli
 from ..utils.console import (
@@ -108,18 +109,83 @@ def init_command() -> None:
     )
 
 
-def list_command() -> None:
-    """List all PRDs with detailed information."""
+def _read_prd(prd_file: Path) -> Dict[str, Any]:
+    """Summarize one PRD file.
+
+    Args:
+        prd_file: Path to the PRD markdown file
+
+    Returns:
+        Dictionary with the PRD's name, title, line and word counts, and path
+    """
+    name = prd_file.stem
+    # Try to read the first line as title and get file stats
+    try:
+        with open(prd_file, "r") as f:
+            content = f.read()
+            first_line = content.split("\n")[0].strip()
+            if first_line.startswith("#"):
+                title = first_line.lstrip("#").strip()
+            else:
+                title = name
+
+            # Get basic stats
+            lines = len(content.split("\n"))
+            words = len(content.split())
+
+    except Exception:
+        title = name
+        lines = words = 0
+
+    return {
+        "name": name,
+        "title": title,
+        "lines": lines,
+        "words": words,
+        "path": str(prd_file),
+    }
+
+
+def _count_epics(epics_dir: Path) -> int:
+    """Count the epic directories under epics_dir, 0 if it does not exist."""
+    if not epics_dir.exists():
+        return 0
+    return sum(1 for d in epics_dir.iterdir() if d.is_dir())
+
+
+def list_command(as_json: bool = False) -> None:
+    """List all PRDs with detailed information.
+
+    Args:
+        as_json: Print a JSON document instead of the formatted listing
+    """
     # First check if .claude directory exists
     cwd = Path.cwd()
     if not (cwd / ".claude").exists():
         print_error("No CCPM installation found. Run 'ccpm setup .' first.")
         raise RuntimeError("CCPM not installed")
 
+    prds_dir = cwd / ".claude" / "prds"
+    epics_dir = cwd / ".claude" / "epics"
+
+    if as_json:
+        prd_files = sorted(prds_dir.glob("*.md")) if prds_dir.exists() else []
+        # ASCII-escaped so any console encoding can print it unchanged
+        safe_print(
+            json.dumps(
+                {
+                    "location": str(prds_dir),
+                    "prds": [_read_prd(prd_file) for prd_file in prd_files],
+                    "epics": _count_epics(epics_dir),
+                },
+                indent=2,
+            )
+        )
+        return
+
     safe_print(f"{get_emoji('🔍', 'Searching for PRDs...')}")
 
     # Check for PRDs directory
-    prds_dir = cwd / ".claude" / "prds"
     if not prds_dir.exists():
         safe_print("\n" + "=" * 50)
         safe_print(f"{get_emoji('📄', 'PRDs')} Product Requirements Documents")
@@ -143,40 +209,20 @@ def list_command() -> None:
         return
 
     for prd_file in sorted(prd_files):
-        name = prd_file.stem
-        # Try to read the first line as title and get file stats
-        try:
-            with open(prd_file, "r") as f:
-                content = f.read()
-                first_line = content.split("\n")[0].strip()
-                if first_line.startswith("#"):
-                    title = first_line.lstrip("#").strip()
-                else:
-                    title = name
-
-                # Get basic stats
-                lines = len(content.split("\n"))
-                words = len(content.split())
-
-        except Exception:
-            title = name
-            lines = words = 0
-
-        safe_print(f"  {get_emoji('📄', '•')} {name}")
-        safe_print(f"    Title: {title}")
-        safe_print(f"    Stats: {lines} lines, {words} words")
-        safe_print(f"    Path:  {prd_file}")
+        prd = _read_prd(prd_file)
+        safe_print(f"  {get_emoji('📄', '•')} {prd['name']}")
+        safe_print(f"    Title: {prd['title']}")
+        safe_print(f"    Stats: {prd['lines']} lines, {prd['words']} words")
+        safe_print(f"    Path:  {prd['path']}")
         safe_print("")
 
     safe_print(f"Total: {len(prd_files)} PRD(s)")
     safe_print(f"Location: {prds_dir}")
 
     # Also check for related epics
-    epics_dir = cwd / ".claude" / "epics"
-    if epics_dir.exists():
-        epic_dirs = [d for d in epics_dir.iterdir() if d.is_dir()]
-        if epic_dirs:
-            safe_print(f"\nRelated: {len(epic_dirs)} epic(s) in {epics_dir}")
+    epic_count = _count_epics(epics_dir)
+    if epic_count:
+        safe_print(f"\nRelated: {epic_count} epic(s) in {epics_dir}")
 
     safe_print(
         f"\n{get_emoji('💡', 'Tip:')} Use 'ccpm status' for detailed project dashboard"
@@ -1,12 +1,15 @@
 """CCPM installation and setup logic."""
 
-import json
+import contextlib
 import os
 import shutil
+import stat
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import FrozenSet, Iterator, List, Tuple
 
 from ..utils.backup import BackupManager
 from ..utils.console import (
@@ -18,10 +21,120 @@ from ..utils.console import (
     safe_input,
     safe_print,
 )
+from ..utils.fastcopy import fast_copy
+from ..utils.jsonio import dumps, load_member, loads
 from ..utils.shell import run_command, run_pm_script
 from .config import ConfigManager
 from .github import GitHubCLI
 from .merger import DirectoryMerger
+from .tracking import TrackingData
+
+# Known CCPM template files that are safe to remove in clean installs
+_TEMPLATE_FILES: FrozenSet[str] = frozenset(
+    {
+        "agents/code-analyzer.md",
+        "agents/file-analyzer.md",
+        "agents/parallel-worker.md",
+        "agents/test-runner.md",
+        "context/README.md",
+        "prds/.gitkeep",
+        "epics/.gitkeep",
+        "commands/code-rabbit.md",
+        "commands/prompt.md",
+        "commands/re-init.md",
+        "commands/context/create.md",
+        "commands/context/update.md",
+        "commands/context/prime.md",
+        "commands/testing/run.md",
+        "commands/testing/prime.md",
+        "rules/worktree-operations.md",
+        "rules/standard-patterns.md",
+        "rules/github-operations.md",
+        "rules/frontmatter-operations.md",
+        "rules/datetime.md",
+        "rules/branch-management.md",
+        "rules/iteration-patterns.md",
+        "rules/project-structure.md",
+        "rules/tracking-operations.md",
+        "rules/code-generation.md",
+        "rules/coordination-operations.md",
+        "rules/agent-coordination.md",
+        "rules/branch-operations.md",
+        "rules/strip-frontmatter.md",
+        "rules/test-execution.md",
+        "rules/use-ast-grep.md",
+        "scripts/utils.sh",
+    }
+)
+
+# Template files left in .claude/ that conservative uninstall may remove
+_REMOVABLE_TEMPLATE_FILES: FrozenSet[str] = frozenset(
+    {
+        "settings.local.json",
+        "CLAUDE.md",
+        "agents/code-analyzer.md",
+        "agents/file-analyzer.md",
+        "agents/parallel-worker.md",
+        "agents/test-runner.md",
+        "context/README.md",
+        "prds/.gitkeep",
+        "epics/.gitkeep",
+    }
+)
+
+# Only CCPM scaffolding is tracked, never user content
+_CCPM_SCAFFOLDING_FILES: Tuple[str, ...] = (
+    "scripts/pm/",  # PM shell scripts
+    "scripts/test-and-log.sh",  # Test runner script
+    "commands/pm/",  # PM command templates
+    "settings.local.json",  # Template settings
+    "context/",  # Context templates (if exists)
+    "CLAUDE.md",  # Project instructions
+)
+
+# NEVER track user content directories:
+# - agents/  (user-created task agents)
+# - prds/    (user product requirements)
+# - epics/   (user project epics)
+_USER_CONTENT_DIRS: Tuple[str, ...] = ("agents", "prds", "epics", "context/custom")
+
+# Directories checked for template-only content on clean uninstall
+_CLEAN_TEMPLATE_DIRS: Tuple[str, ...] = (
+    "agents",
+    "prds",
+    "epics",
+    "commands",
+    "rules",
+    "scripts",
+    "context",
+)
+
+# Entries setup makes sure the project .gitignore contains
+_GITIGNORE_ENTRIES: Tuple[str, ...] = (
+    ".ccpm_tracking.json",
+    ".ccpm_backup/",
+    ".claude/epics/",
+    ".claude/prds/",
+)
+
+# Backoff between rmdir attempts while Windows releases file handles
+_RMDIR_RETRY_DELAYS: Tuple[float, ...] = (0.01, 0.02, 0.05, 0.1)
+
+# Top-level .claude/ entries that belong to the standard CCPM template
+_CCPM_TEMPLATE_ITEMS: FrozenSet[str] = frozenset(
+    {
+        "agents",
+        "commands",
+        "context",
+        "epics",
+        "prds",
+        "scripts",
+        "settings.local.json",
+        "CLAUDE.md",
+        ".gitkeep",
+        "README.md",
+    }
+)
 
 
 class CCPMInstaller:
@@ -44,6 +157,29 @@ class CCPMInstaller:
         self.config = ConfigManager(self.target)
         self.merger = DirectoryMerger()
 
+    @staticmethod
+    def _retry_rmdir(path: Path) -> None:
+        """Remove an empty directory, retrying while it is still busy.
+
+        On Windows, handles to just-removed files can keep the directory
+        locked for a moment, so permission errors are retried with backoff.
+        Any other error cannot clear by waiting and is raised immediately.
+
+        Args:
+            path: Empty directory to remove
+
+        Raises:
+            OSError: If the directory cannot be removed, for a permission
+                error only after all retries
+        """
+        for delay in _RMDIR_RETRY_DELAYS:
+            try:
+                os.rmdir(path)
+                return
+            except PermissionError:
+                time.sleep(delay)
+        os.rmdir(path)
+
     def setup(self) -> None:
         """Main setup flow with automatic GitHub CLI installation."""
         safe_print(f"\n{get_emoji('🚀', '>>>')} Setting up CCPM...")
@@ -64,78 +200,77 @@ class CCPMInstaller:
                     "You may need to run 'gh auth login' later."
                 )
 
-        # 4. Install required extensions
-        self.gh_cli.install_extensions()
-
-        # 5. Check for existing .claude directory
-        existing_claude = self.claude_dir.exists()
-        if existing_claude:
-            safe_print(f"\n{get_emoji('📁', '>>>')} Found existing .claude directory")
-            # Backup existing content
-            backup_path = self.backup.create_backup(self.claude_dir)
-            print_success(f"Backed up to: {backup_path}")
-
-        # 6. Copy bundled .claude template
-        safe_print("\n📥 Installing CCPM files...")
-
         # Get the bundled claude_template from the package
         import ccpm
 
         package_dir = Path(ccpm.__file__).parent
         claude_template = package_dir / "claude_template"
 
-        if not claude_template.exists():
-            # Fallback to cloning from repository if template not found
-            safe_print("\n📥 Downloading CCPM from repository...")
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_path = Path(tmpdir)
+        with contextlib.ExitStack() as stack:
+            clone_future = None
+            if not claude_template.exists():
+                # Fallback to cloning from repository if template not found.
+                # The clone runs in the background while extensions install.
+                safe_print("\n📥 Downloading CCPM from repository...")
+                tmp_path = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+                clone_future = executor.submit(self._clone_ccpm_repo, tmp_path / "ccpm")
+                claude_template = tmp_path / "ccpm" / ".claude"
 
-                result = run_command(
-                    [
-                        "git",
-                        "clone",
-                        "--depth",
-                        "1",
-                        self.CCPM_REPO,
-                        str(tmp_path / "ccpm"),
-                    ]
-                )
+            # 4. Install required extensions
+            self.gh_cli.install_extensions()
 
-                if result[0] != 0:
-                    raise RuntimeError(f"Failed to clone CCPM repository: {result[2]}")
+            # 5. Check for existing .claude directory
+            existing_claude = self.claude_dir.exists()
+            if existing_claude:
+                safe_print(
+                    f"\n{get_emoji('📁', '>>>')} Found existing .claude directory"
+                )
+                # Backup existing content
+                backup_path = self.backup.create_backup(self.claude_dir)
+                print_success(f"Backed up to: {backup_path}")
 
-                claude_template = tmp_path / "ccpm" / ".claude"
+            # 6. Copy bundled .claude template
+            safe_print("\n📥 Installing CCPM files...")
 
+            if clone_future is not None:
+                # Re-raises the clone failure, if any
+                clone_future.result()
                 if not claude_template.exists():
                     raise RuntimeError(
                         "CCPM repository does not contain .claude directory"
                     )
 
-        # 7. Handle existing .claude directory with backup and merge
-        backup_dir = self.claude_dir.parent / ".claude.backup"
-
-        if existing_claude:
-            safe_print(
-                f"\n{get_emoji('💾', '>>>')} Backing up existing .claude directory..."
-            )
-            # Remove old backup if exists
-            if backup_dir.exists():
-                shutil.rmtree(backup_dir)
-            # Move existing .claude to backup
-            shutil.move(str(self.claude_dir), str(backup_dir))
+            # 7. Handle existing .claude directory with backup and merge
+            backup_dir = self.claude_dir.parent / ".claude.backup"
 
-            # Copy new .claude directory
-            safe_print("\n📂 Installing new .claude directory...")
-            shutil.copytree(claude_template, self.claude_dir)
+            if existing_claude:
+                safe_print(
+                    f"\n{get_emoji('💾', '>>>')} Backing up existing .claude "
+                    "directory..."
+                )
+                # Remove old backup if exists
+                if backup_dir.exists():
+                    shutil.rmtree(backup_dir)
+                # Move existing .claude to backup
+                shutil.move(str(self.claude_dir), str(backup_dir))
+
+                # Copy new .claude directory
+                safe_print("\n📂 Installing new .claude directory...")
+                shutil.copytree(
+                    claude_template, self.claude_dir, copy_function=fast_copy
+                )
 
-            # Merge user content from backup
-            safe_print(
-                f"\n{get_emoji('🔄', '>>>')} Merging user content from backup..."
-            )
-            self._merge_user_content_from_backup(backup_dir)
-        else:
-            safe_print("\n📂 Creating .claude directory...")
-            shutil.copytree(claude_template, self.claude_dir)
+                # Merge user content from backup
+                safe_print(
+                    f"\n{get_emoji('🔄', '>>>')} Merging user content from backup..."
+                )
+                self._merge_user_content_from_backup(backup_dir)
+            else:
+                safe_print("\n📂 Creating .claude directory...")
+                shutil.copytree(
+                    claude_template, self.claude_dir, copy_function=fast_copy
+                )
 
         # 8. Initialize git repository if needed
         if not (self.target / ".git").exists():
@@ -190,19 +325,7 @@ class CCPMInstaller:
                 tmp_path = Path(tmpdir)
 
                 # Clone the repository
-                result = run_command(
-                    [
-                        "git",
-                        "clone",
-                        "--depth",
-                        "1",
-                        self.CCPM_REPO,
-                        str(tmp_path / "ccpm"),
-                    ]
-                )
-
-                if result[0] != 0:
-                    raise RuntimeError(f"Failed to clone CCPM repository: {result[2]}")
+                self._clone_ccpm_repo(tmp_path / "ccpm")
 
                 ccpm_claude = tmp_path / "ccpm" / ".claude"
                 if not ccpm_claude.exists():
@@ -305,33 +428,27 @@ class CCPMInstaller:
             # Skip context directory entirely to preserve user content
             if file_path.startswith("context"):
                 continue
-            if full_path.exists():
-                try:
-                    if full_path.is_dir():
-                        # For scaffolding directories, remove them completely
-                        # They're explicitly tracked as safe to remove
-                        shutil.rmtree(full_path)
-                        removed_count += 1
-                    else:
-                        full_path.unlink()
-                        removed_count += 1
-                except Exception as exc:
-                    print_warning(f"Could not remove {file_path}: {exc}")
+            # Single stat call decides both existence and file type
+            try:
+                st = os.stat(full_path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            try:
+                if stat.S_ISDIR(st.st_mode):
+                    # For scaffolding directories, remove them completely
+                    # They're explicitly tracked as safe to remove
+                    shutil.rmtree(full_path)
+                else:
+                    os.unlink(full_path)
+                removed_count += 1
+            except Exception as exc:
+                print_warning(f"Could not remove {file_path}: {exc}")
 
         # For clean installations, remove template-only directories
         if not tracking.get("had_existing_claude", True):
             # Check all remaining directories for template-only content
             # For clean installs, we can also clean context directory of template files
-            template_dirs_to_check = [
-                "agents",
-                "prds",
-                "epics",
-                "commands",
-                "rules",
-                "scripts",
-                "context",
-            ]
-            for dir_name in template_dirs_to_check:
+            for dir_name in _CLEAN_TEMPLATE_DIRS:
                 dir_path = self.claude_dir / dir_name
                 if dir_path.exists() and self._is_template_only_directory(dir_path):
                     try:
@@ -354,14 +471,7 @@ class CCPMInstaller:
                 # Check if directory is empty
                 remaining_items = list(self.claude_dir.iterdir())
                 if not remaining_items:
-                    # On Windows, sometimes we need to wait a moment for handles
-                    # to close
-                    import sys
-                    import time
-
-                    if sys.platform == "win32":
-                        time.sleep(0.1)
-                    self.claude_dir.rmdir()
+                    self._retry_rmdir(self.claude_dir)
                 elif (
                     len(remaining_items) == 1
                     and remaining_items[0].name == "settings.local.json"
@@ -369,9 +479,7 @@ class CCPMInstaller:
                     # Sometimes settings file is left behind, remove it too
                     try:
                         remaining_items[0].unlink()
-                        if sys.platform == "win32":
-                            time.sleep(0.1)
-                        self.claude_dir.rmdir()
+                        self._retry_rmdir(self.claude_dir)
                     except Exception:
                         pass  # Don't fail the uninstall for this
             except Exception as exc:
@@ -384,11 +492,7 @@ class CCPMInstaller:
                 f"\n{get_emoji('🔄', '>>>')} Restoring previous .claude directory..."
             )
             try:
-                # Remove current .claude directory if it exists
-                if self.claude_dir.exists():
-                    shutil.rmtree(self.claude_dir)
-                # Restore from backup
-                shutil.move(str(backup_dir), str(self.claude_dir))
+                self._restore_claude_backup(backup_dir)
                 print_success("Previous .claude directory restored")
             except Exception as exc:
                 print_warning(f"Could not restore backup: {exc}")
@@ -397,44 +501,78 @@ class CCPMInstaller:
         print_success(f"Removed {removed_count} CCPM files, preserved user content")
         print_success("\nCCPM uninstalled successfully!")
 
+    def _restore_claude_backup(self, backup_dir: Path) -> None:
+        """Put a .claude.backup directory back in place of .claude.
+
+        The swap is done with renames so the restored directory appears in a
+        single step; the replaced tree is deleted afterwards.
+
+        Args:
+            backup_dir: Path to the .claude.backup directory
+        """
+        stale_dir = self.claude_dir.with_name(".claude.deleting")
+        try:
+            if self.claude_dir.exists():
+                if stale_dir.exists():
+                    shutil.rmtree(stale_dir)
+                os.replace(self.claude_dir, stale_dir)
+            os.replace(backup_dir, self.claude_dir)
+        except OSError:
+            # Renames can fail across filesystems; fall back to copy semantics
+            if self.claude_dir.exists():
+                shutil.rmtree(self.claude_dir)
+            shutil.move(str(backup_dir), str(self.claude_dir))
+        shutil.rmtree(stale_dir, ignore_errors=True)
+
+    def _clone_ccpm_repo(self, dest: Path) -> None:
+        """Clone only the .claude directory of the CCPM repository.
+
+        A blobless, sparse clone fetches and checks out the .claude tree plus
+        top-level files instead of the whole repository.
+
+        Args:
+            dest: Directory to clone into
+
+        Raises:
+            RuntimeError: If the clone fails
+        """
+        result = run_command(
+            [
+                "git",
+                "clone",
+                "--depth",
+                "1",
+                "--filter=blob:none",
+                "--sparse",
+                self.CCPM_REPO,
+                str(dest),
+            ]
+        )
+        if result[0] == 0:
+            result = run_command(
+                ["git", "-C", str(dest), "sparse-checkout", "set", ".claude"]
+            )
+
+        if result[0] != 0:
+            raise RuntimeError(f"Failed to clone CCPM repository: {result[2]}")
+
     def _create_tracking_file(self, had_existing: bool) -> None:
         """Create tracking file for uninstall.
 
         Args:
             had_existing: Whether there was an existing .claude directory
         """
-        tracking_data = {
+        tracking_data: TrackingData = {
             "version": "0.1.0",
             "installed_at": datetime.now().isoformat(),
             "had_existing_claude": had_existing,
             "ccpm_files": [],
+            "ccpm_scaffolding_files": list(_CCPM_SCAFFOLDING_FILES),
+            # For informational purposes
+            "user_content_dirs": list(_USER_CONTENT_DIRS),
+            "data_safety_version": "1.0",  # Track safety model version
         }
 
-        # Only track CCPM scaffolding files, never user content
-        ccpm_scaffolding_files = [
-            "scripts/pm/",  # PM shell scripts
-            "scripts/test-and-log.sh",  # Test runner script
-            "commands/pm/",  # PM command templates
-            "settings.local.json",  # Template settings
-            "context/",  # Context templates (if exists)
-            "CLAUDE.md",  # Project instructions
-        ]
-
-        # NEVER track user content directories:
-        # - agents/  (user-created task agents)
-        # - prds/    (user product requirements)
-        # - epics/   (user project epics)
-
-        user_content_dirs = ["agents", "prds", "epics", "context/custom"]
-
-        tracking_data.update(
-            {
-                "ccpm_scaffolding_files": ccpm_scaffolding_files,
-                "user_content_dirs": user_content_dirs,  # For informational purposes
-                "data_safety_version": "1.0",  # Track safety model version
-            }
-        )
-
         self._save_tracking_file(tracking_data)
 
     def _is_template_file(self, file_path: Path) -> bool:
@@ -452,25 +590,12 @@ class CCPMInstaller:
         # Get relative path from .claude directory
         try:
             rel_path = file_path.relative_to(self.claude_dir)
-            rel_path_str = str(rel_path).replace("\\", "/")  # Normalize for Windows
+            rel_path_str = rel_path.as_posix()  # Normalize for Windows
         except ValueError:
             return False
 
-        # Known CCPM template files that are safe to remove
-        template_files = {
-            "settings.local.json",
-            "CLAUDE.md",
-            "agents/code-analyzer.md",
-            "agents/file-analyzer.md",
-            "agents/parallel-worker.md",
-            "agents/test-runner.md",
-            "context/README.md",
-            "prds/.gitkeep",
-            "epics/.gitkeep",
-        }
-
         # Check if it's a known template file
-        if rel_path_str in template_files:
+        if rel_path_str in _REMOVABLE_TEMPLATE_FILES:
             return True
 
         # Check if it's a template directory
@@ -512,7 +637,8 @@ class CCPMInstaller:
         Returns:
             True if safe to remove, False if contains user content
         """
-        if not directory.exists() or not directory.is_dir():
+        # is_dir() is also False for missing paths, one stat covers both
+        if not directory.is_dir():
             return True
 
         # Check for user content patterns
@@ -526,7 +652,8 @@ class CCPMInstaller:
         ]
 
         for pattern in user_patterns:
-            if list(directory.rglob(pattern)):
+            # Stop at the first match instead of collecting the whole tree
+            if any(directory.rglob(pattern)):
                 return False
 
         return True
@@ -542,55 +669,35 @@ class CCPMInstaller:
         Returns:
             True if directory only contains CCPM templates, False if it has user content
         """
-        if not directory.exists() or not directory.is_dir():
+        # is_dir() is also False for missing paths, one stat covers both
+        if not directory.is_dir():
             return True
 
-        # Known CCPM template files that are safe to remove
-        template_files = {
-            "agents/code-analyzer.md",
-            "agents/file-analyzer.md",
-            "agents/parallel-worker.md",
-            "agents/test-runner.md",
-            "context/README.md",
-            "prds/.gitkeep",
-            "epics/.gitkeep",
-            "commands/code-rabbit.md",
-            "commands/prompt.md",
-            "commands/re-init.md",
-            "commands/context/create.md",
-            "commands/context/update.md",
-            "commands/context/prime.md",
-            "commands/testing/run.md",
-            "commands/testing/prime.md",
-            "rules/worktree-operations.md",
-            "rules/standard-patterns.md",
-            "rules/github-operations.md",
-            "rules/frontmatter-operations.md",
-            "rules/datetime.md",
-            "rules/branch-management.md",
-            "rules/iteration-patterns.md",
-            "rules/project-structure.md",
-            "rules/tracking-operations.md",
-            "rules/code-generation.md",
-            "rules/coordination-operations.md",
-            "rules/agent-coordination.md",
-            "rules/branch-operations.md",
-            "rules/strip-frontmatter.md",
-            "rules/test-execution.md",
-            "rules/use-ast-grep.md",
-            "scripts/utils.sh",
-        }
+        # Directory is template-only if all files are known templates.
+        # all() stops walking at the first non-template file.
+        return all(
+            rel_path in _TEMPLATE_FILES for rel_path in self._iter_rel_files(directory)
+        )
+
+    def _iter_rel_files(self, directory: Path) -> Iterator[str]:
+        """Walk a directory and yield its files relative to .claude/.
 
-        # Get all files in directory relative to .claude/
-        # claude_relative = directory.relative_to(self.claude_dir)  # Unused
-        all_files = set()
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(self.claude_dir)
-                all_files.add(str(relative_path))
+        Args:
+            directory: Directory inside .claude/ to walk
 
-        # Directory is template-only if all files are known templates
-        return all_files.issubset(template_files)
+        Yields:
+            Relative file paths with forward slashes
+        """
+        # Entry paths all start with the .claude/ path, so slice it off
+        prefix_len = len(str(self.claude_dir)) + len(os.sep)
+        stack = [str(directory)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path[prefix_len:].replace(os.sep, "/")
 
     def _safe_uninstall_without_tracking(self) -> None:
         """Safely uninstall without tracking file (conservative approach)."""
@@ -602,45 +709,40 @@ class CCPMInstaller:
         removed_count = 0
         for file_path in safe_to_remove:
             full_path = self.claude_dir / file_path
-            if full_path.exists():
-                try:
-                    if full_path.is_dir():
-                        if self._is_directory_empty_of_user_content(full_path):
-                            shutil.rmtree(full_path)
-                            removed_count += 1
-                    else:
-                        full_path.unlink()
+            try:
+                st = os.stat(full_path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            try:
+                if stat.S_ISDIR(st.st_mode):
+                    if self._is_directory_empty_of_user_content(full_path):
+                        shutil.rmtree(full_path)
                         removed_count += 1
-                except Exception as exc:
-                    print_warning(f"Could not remove {file_path}: {exc}")
+                else:
+                    os.unlink(full_path)
+                    removed_count += 1
+            except Exception as exc:
+                print_warning(f"Could not remove {file_path}: {exc}")
 
         # Carefully handle scripts directory
         scripts_dir = self.claude_dir / "scripts"
-        if scripts_dir.exists():
-            pm_dir = scripts_dir / "pm"
-            if pm_dir.exists() and self._is_directory_empty_of_user_content(pm_dir):
-                try:
-                    shutil.rmtree(pm_dir)
-                    removed_count += 1
-                    # Remove scripts dir if it's now empty
-                    if not list(scripts_dir.iterdir()):
-                        scripts_dir.rmdir()
-                except Exception as exc:
-                    print_warning(f"Could not remove scripts/pm: {exc}")
+        pm_dir = scripts_dir / "pm"
+        if pm_dir.is_dir() and self._is_directory_empty_of_user_content(pm_dir):
+            try:
+                shutil.rmtree(pm_dir)
+                removed_count += 1
+                # Remove scripts dir if it's now empty
+                if not any(scripts_dir.iterdir()):
+                    scripts_dir.rmdir()
+            except Exception as exc:
+                print_warning(f"Could not remove scripts/pm: {exc}")
 
         # If .claude directory is now empty or only has template files, remove it
         if self.claude_dir.exists():
             try:
                 remaining_items = list(self.claude_dir.iterdir())
                 if not remaining_items:
-                    # On Windows, sometimes we need to wait a moment for handles
-                    # to close
-                    import sys
-                    import time
-
-                    if sys.platform == "win32":
-                        time.sleep(0.1)
-                    self.claude_dir.rmdir()
+                    self._retry_rmdir(self.claude_dir)
                 elif all(self._is_template_file(item) for item in remaining_items):
                     # Remove remaining template files and the directory
                     for item in remaining_items:
@@ -652,9 +754,7 @@ class CCPMInstaller:
                         except Exception:
                             pass  # Don't fail uninstall for cleanup issues
                     try:
-                        if sys.platform == "win32":
-                            time.sleep(0.1)
-                        self.claude_dir.rmdir()
+                        self._retry_rmdir(self.claude_dir)
                     except Exception:
                         pass
             except Exception as exc:
@@ -662,41 +762,38 @@ class CCPMInstaller:
 
         print_success(f"Removed {removed_count} CCPM files using conservative approach")
 
-    def _load_tracking_file(self) -> Dict[str, Any]:
+    def _load_tracking_file(self) -> TrackingData:
         """Load tracking file."""
         if self.tracking_file.exists():
-            with open(self.tracking_file, "r") as f:
-                return json.load(f)
+            with open(self.tracking_file, "r", encoding="utf-8") as f:
+                tracking: TrackingData = loads(f.read())
+            return tracking
         return {}
 
-    def _save_tracking_file(self, data: Dict[str, Any]) -> None:
+    def _save_tracking_file(self, data: TrackingData) -> None:
         """Save tracking file."""
-        with open(self.tracking_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(self.tracking_file, "w", encoding="utf-8") as f:
+            f.write(dumps(data))
 
     def _update_gitignore(self) -> None:
         """Update .gitignore to exclude tracking file."""
         gitignore = self.target / ".gitignore"
 
-        entries_to_add = [
-            ".ccpm_tracking.json",
-            ".ccpm_backup/",
-            ".claude/epics/",
-            ".claude/prds/",
-        ]
-
-        if gitignore.exists():
+        try:
             content = gitignore.read_text()
-        else:
+        except FileNotFoundError:
             content = ""
 
-        lines = content.splitlines() if content else []
-
-        for entry in entries_to_add:
-            if entry not in lines:
-                lines.append(entry)
+        existing = set(content.splitlines())
+        missing = [entry for entry in _GITIGNORE_ENTRIES if entry not in existing]
 
-        gitignore.write_text("\n".join(lines) + "\n")
+        # Leave an up-to-date .gitignore untouched, otherwise append only
+        # the missing entries instead of rewriting the whole file
+        if missing:
+            with open(gitignore, "a") as f:
+                if content and not content.endswith("\n"):
+                    f.write("\n")
+                f.write("\n".join(missing) + "\n")
 
     def _merge_user_content_from_backup(self, backup_dir: Path) -> None:
         """Merge user content from backup directory into new installation.
@@ -727,14 +824,14 @@ class CCPMInstaller:
                 if item.is_dir():
                     # Copy entire user directories
                     if not target_item.exists():
-                        shutil.copytree(item, target_item)
+                        shutil.copytree(item, target_item, copy_function=fast_copy)
                     else:
                         # Merge directory contents
                         self._merge_directory_contents(item, target_item)
                 elif item.is_file():
                     # Only copy user files, skip template files like .gitkeep
                     if item.name not in [".gitkeep", "README.md"]:
-                        shutil.copy2(item, target_item)
+                        fast_copy(item, target_item)
 
         # Also preserve any custom settings from settings.local.json
         backup_settings = backup_dir / "settings.local.json"
@@ -745,21 +842,8 @@ class CCPMInstaller:
 
         # Preserve custom files and directories in root of backup directory
         # These are things that don't belong to the standard CCPM template
-        ccpm_template_items = {
-            "agents",
-            "commands",
-            "context",
-            "epics",
-            "prds",
-            "scripts",
-            "settings.local.json",
-            "CLAUDE.md",
-            ".gitkeep",
-            "README.md",
-        }
-
         for item in backup_dir.iterdir():
-            if item.name in ccpm_template_items:
+            if item.name in _CCPM_TEMPLATE_ITEMS:
                 continue
 
             target_item = self.claude_dir / item.name
@@ -767,14 +851,14 @@ class CCPMInstaller:
             if item.is_dir():
                 # Copy custom directories that don't exist in template
                 if not target_item.exists():
-                    shutil.copytree(item, target_item)
+                    shutil.copytree(item, target_item, copy_function=fast_copy)
                 else:
                     # Merge if directory exists in template
                     self._merge_directory_contents(item, target_item)
             elif item.is_file():
                 # Copy custom files that don't exist in template
                 if not target_item.exists():
-                    shutil.copy2(item, target_item)
+                    fast_copy(item, target_item)
 
     def _merge_directory_contents(self, source_dir: Path, target_dir: Path) -> None:
         """Recursively merge directory contents."""
@@ -783,7 +867,7 @@ class CCPMInstaller:
 
             if item.is_dir():
                 if not target_item.exists():
-                    shutil.copytree(item, target_item)
+                    shutil.copytree(item, target_item, copy_function=fast_copy)
                 else:
                     self._merge_directory_contents(item, target_item)
             elif item.is_file():
@@ -792,52 +876,51 @@ class CCPMInstaller:
                     ".gitkeep",
                     "README.md",
                 ]:
-                    shutil.copy2(item, target_item)
+                    fast_copy(item, target_item)
 
     def _merge_settings_files(
         self, backup_settings: Path, target_settings: Path
     ) -> None:
         """Merge user settings from backup into new settings file."""
         try:
-            import json
-
-            # Load both files
-            with open(backup_settings) as f:
-                backup_data = json.load(f)
-            with open(target_settings) as f:
-                target_data = json.load(f)
+            # Load both files; only the backup's permissions are needed
+            with open(backup_settings, "rb") as f:
+                backup_permissions = load_member(f, "permissions")
+            with open(target_settings, encoding="utf-8") as f:
+                target_data = loads(f.read())
 
             # Merge permissions if they exist in backup
-            if "permissions" in backup_data:
+            if backup_permissions is not None:
                 if "permissions" not in target_data:
                     target_data["permissions"] = {}
 
                 # Merge allow/deny/ask lists
                 for perm_type in ["allow", "deny", "ask"]:
-                    if perm_type in backup_data["permissions"]:
+                    if perm_type in backup_permissions:
                         if perm_type not in target_data["permissions"]:
                             target_data["permissions"][perm_type] = []
-                        # Add unique entries from backup
-                        for item in backup_data["permissions"][perm_type]:
-                            if item not in target_data["permissions"][perm_type]:
-                                target_data["permissions"][perm_type].append(item)
+                        # Add unique entries from backup, keeping target order
+                        target_list = target_data["permissions"][perm_type]
+                        existing = set(target_list)
+                        for item in backup_permissions[perm_type]:
+                            if item not in existing:
+                                existing.add(item)
+                                target_list.append(item)
 
                 # Merge additionalDirectories
-                if "additionalDirectories" in backup_data["permissions"]:
+                if "additionalDirectories" in backup_permissions:
                     if "additionalDirectories" not in target_data["permissions"]:
                         target_data["permissions"]["additionalDirectories"] = []
-                    for dir_path in backup_data["permissions"]["additionalDirectories"]:
-                        if (
-                            dir_path
-                            not in target_data["permissions"]["additionalDirectories"]
-                        ):
-                            target_data["permissions"]["additionalDirectories"].append(
-                                dir_path
-                            )
+                    target_dirs = target_data["permissions"]["additionalDirectories"]
+                    existing_dirs = set(target_dirs)
+                    for dir_path in backup_permissions["additionalDirectories"]:
+                        if dir_path not in existing_dirs:
+                            existing_dirs.add(dir_path)
+                            target_dirs.append(dir_path)
 
             # Save merged settings
-            with open(target_settings, "w") as f:
-                json.dump(target_data, f, indent=2)
+            with open(target_settings, "w", encoding="utf-8") as f:
+                f.write(dumps(target_data))
 
         except Exception as exc:
             print_warning(f"Could not merge settings files: {exc}")
@@ -1,8 +1,56 @@
 """Directory merging logic for CCPM installation."""
 
+import filecmp
+import fnmatch
+import os
+import re
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set
+from typing import Iterable, List, Optional, Pattern, Set, Tuple
+
+from ..utils.console import safe_print
+
+# Thread count for parallel file copies during a merge
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _up_to_date(source: Path, target: Path) -> bool:
+    """Check whether a target file already matches its source.
+
+    Permission bits are compared as well, so a script that lost its
+    executable bit is copied again even when its content is unchanged.
+
+    Args:
+        source: Source file
+        target: Existing target file
+
+    Returns:
+        True if both files have the same permission bits and bytes
+    """
+    if stat.S_IMODE(source.stat().st_mode) != stat.S_IMODE(target.stat().st_mode):
+        return False
+    # Checks the size first and stops reading at the first difference
+    return filecmp.cmp(source, target, shallow=False)
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Pattern[str]:
+    """Compile glob patterns into a single alternation regex.
+
+    The result matches exactly like fnmatch.fnmatchcase against any of the
+    patterns: case-sensitive on every platform, with separators normalized to
+    forward slashes.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Compiled regex matching any of the patterns
+    """
+    return re.compile(
+        "|".join(fnmatch.translate(p.replace("\\", "/")) for p in sorted(patterns))
+    )
 
 
 class DirectoryMerger:
@@ -14,6 +62,10 @@ class DirectoryMerger:
     # Files that should never be overwritten (user customizations)
     PRESERVE_FILES = {"CLAUDE.md", "settings.local.json", "context/*.md", "rules/*.md"}
 
+    # One regex per category so each file is matched in a single pass
+    _OVERWRITE_RE = _compile_patterns(OVERWRITE_FILES)
+    _PRESERVE_RE = _compile_patterns(PRESERVE_FILES)
+
     def merge_directories(
         self, source: Path, target: Path, update_mode: bool = False
     ) -> None:
@@ -33,23 +85,36 @@ class DirectoryMerger:
         # Get all files from source
         source_files = self._get_all_files(source)
 
-        for rel_path in source_files:
+        # Decide which files to copy before touching the target, noting
+        # whether each one already existed for the summary below
+        report: List[str] = []
+        src_files: List[Path] = []
+        tgt_files: List[Path] = []
+        for rel_path in sorted(source_files):
             src_file = source / rel_path
             tgt_file = target / rel_path
 
-            # Decide whether to copy this file
-            should_copy = self._should_copy_file(rel_path, tgt_file, update_mode)
+            should_copy, existed = self._should_copy_file(
+                rel_path, tgt_file, update_mode, src_file
+            )
+            if should_copy and src_file.is_file():
+                report.append(f"  {'Updated' if existed else 'Added'}: {rel_path}")
+                src_files.append(src_file)
+                tgt_files.append(tgt_file)
+
+        # Create parent directories once, before any worker needs them
+        for parent in {tgt_file.parent for tgt_file in tgt_files}:
+            parent.mkdir(parents=True, exist_ok=True)
 
-            if should_copy:
-                # Create parent directory if needed
-                tgt_file.parent.mkdir(parents=True, exist_ok=True)
+        # Copies are I/O bound and copy2 releases the GIL, so overlap them
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            # Consume the results so a failed copy raises here
+            for _ in executor.map(shutil.copy2, src_files, tgt_files):
+                pass
 
-                # Copy the file
-                if src_file.is_file():
-                    shutil.copy2(src_file, tgt_file)
-                    print(
-                        f"  {'Updated' if tgt_file.exists() else 'Added'}: {rel_path}"
-                    )
+        # List the changes in one write
+        if report:
+            safe_print("\n".join(report))
 
     def _get_all_files(self, directory: Path) -> Set[Path]:
         """Get all files in a directory recursively.
@@ -61,78 +126,52 @@ class DirectoryMerger:
             Set of relative paths
         """
         files = set()
-        for item in directory.rglob("*"):
-            if item.is_file():
-                rel_path = item.relative_to(directory)
-                files.add(rel_path)
+        # os.walk classifies entries from scandir data, no stat per file
+        for root, _dirs, names in os.walk(directory):
+            root_rel = os.path.relpath(root, directory)
+            rel_dir = Path(root_rel) if root_rel != "." else Path()
+            for name in names:
+                files.add(rel_dir / name)
         return files
 
     def _should_copy_file(
-        self, rel_path: Path, target_file: Path, update_mode: bool
-    ) -> bool:
+        self,
+        rel_path: Path,
+        target_file: Path,
+        update_mode: bool,
+        source_file: Optional[Path] = None,
+    ) -> Tuple[bool, bool]:
         """Determine if a file should be copied.
 
         Args:
             rel_path: Relative path of the file
             target_file: Target file path
             update_mode: Whether this is an update
+            source_file: Source file path, used to skip identical overwrites
 
         Returns:
-            True if file should be copied
+            Tuple of (should_copy, target_exists)
         """
-        rel_str = str(rel_path)
+        # Convert to forward slashes for consistency
+        rel_str = rel_path.as_posix()
+        exists = target_file.exists()
 
         # Check if file matches preserve patterns
-        for pattern in self.PRESERVE_FILES:
-            if self._matches_pattern(rel_str, pattern):
-                if target_file.exists():
-                    # Never overwrite preserved files
-                    return False
-                else:
-                    # Copy if it doesn't exist
-                    return True
+        if self._PRESERVE_RE.match(rel_str):
+            # Never overwrite preserved files, copy if it doesn't exist
+            return not exists, exists
 
         # Check if file matches overwrite patterns
-        for pattern in self.OVERWRITE_FILES:
-            if self._matches_pattern(rel_str, pattern):
-                # Always copy these files
-                return True
+        if self._OVERWRITE_RE.match(rel_str):
+            # Always copy these files, unless the target is already identical
+            if exists and source_file is not None:
+                return not _up_to_date(source_file, target_file), exists
+            return True, exists
 
         # For other files
         if update_mode:
             # In update mode, only copy if file doesn't exist
-            return not target_file.exists()
+            return not exists, exists
         else:
             # In initial install, copy everything that doesn't exist
-            return not target_file.exists()
-
-    def _matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if a path matches a pattern.
-
-        Args:
-            path: Path to check
-            pattern: Pattern to match (supports * wildcard)
-
-        Returns:
-            True if path matches pattern
-        """
-        # Convert to forward slashes for consistency
-        path = path.replace("\\", "/")
-        pattern = pattern.replace("\\", "/")
-
-        if "*" in pattern:
-            # Simple wildcard matching
-            parts = pattern.split("*")
-            if len(parts) == 2:
-                # Pattern like "dir/*.ext"
-                prefix, suffix = parts
-                return path.startswith(prefix) and path.endswith(suffix)
-            elif pattern == "*":
-                return True
-            elif pattern.endswith("/*"):
-                # Match all files in directory
-                prefix = pattern[:-2]
-                return path.startswith(prefix + "/")
-        else:
-            # Exact match
-            return path == pattern
+            return not exists, exists
@@ -0,0 +1,23 @@
+"""Schema of the .ccpm_tracking.json installation record."""
+
+from typing import List, TypedDict
+
+
+class TrackingData(TypedDict, total=False):
+    """Contents of the tracking file written by setup and read by uninstall.
+
+    Every key is optional: files written by older releases lack the safety
+    fields, and update adds last_updated later.
+    """
+
+    version: str
+    installed_at: str
+    last_updated: str
+    had_existing_claude: bool
+    # Legacy list of installed paths, kept empty by current releases
+    ccpm_files: List[str]
+    # Files under .claude/ that uninstall may remove
+    ccpm_scaffolding_files: List[str]
+    # Directories documented as user content, never removed
+    user_content_dirs: List[str]
+    data_safety_version: str
@@ -1,6 +1,14 @@
 """Utility functions for CCPM."""
 
 from .backup import BackupManager
+from .jsonio import dumps, load_member, loads
 from .shell import run_command, run_pm_script
 
-__all__ = ["run_pm_script", "run_command", "BackupManager"]
+__all__ = [
+    "run_pm_script",
+    "run_command",
+    "BackupManager",
+    "loads",
+    "dumps",
+    "load_member",
+]
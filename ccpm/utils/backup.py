@@ -1,10 +1,16 @@
 """Backup and restore utilities."""
 
-import json
+import re
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+from .fastcopy import fast_copy
+from .jsonio import dumps, loads
+
+# The "_%Y%m%d_%H%M%S" suffix appended to every backup name
+_BACKUP_STAMP_RE = re.compile(r"_(\d{8}_\d{6})$")
+
 
 class BackupManager:
     """Manages backups for CCPM operations."""
@@ -35,27 +41,29 @@ class BackupManager:
         # Create backup directory
         self.backup_root.mkdir(parents=True, exist_ok=True)
 
-        # Generate backup name with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Generate backup name with timestamp, read once for name and metadata
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         backup_name = f"{source.name}_{timestamp}"
         backup_path = self.backup_root / backup_name
 
         # Create backup
-        if source.is_dir():
-            shutil.copytree(source, backup_path)
+        is_dir = source.is_dir()
+        if is_dir:
+            shutil.copytree(source, backup_path, copy_function=fast_copy)
         else:
-            shutil.copy2(source, backup_path)
+            fast_copy(source, backup_path)
 
         # Create metadata file
         metadata = {
             "source": str(source),
-            "created_at": datetime.now().isoformat(),
-            "type": "directory" if source.is_dir() else "file",
+            "created_at": now.isoformat(),
+            "type": "directory" if is_dir else "file",
         }
 
         metadata_file = backup_path.parent / f"{backup_name}.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_file, "w", encoding="utf-8") as f:
+            f.write(dumps(metadata))
 
         return backup_path
 
@@ -78,9 +86,9 @@ class BackupManager:
 
         # Restore backup
         if backup_path.is_dir():
-            shutil.copytree(backup_path, target)
+            shutil.copytree(backup_path, target, copy_function=fast_copy)
         else:
-            shutil.copy2(backup_path, target)
+            fast_copy(backup_path, target)
 
     def list_backups(self) -> list:
         """List all available backups.
@@ -94,8 +102,8 @@ class BackupManager:
         backups = []
         for metadata_file in self.backup_root.glob("*.json"):
             try:
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
+                with open(metadata_file, "r", encoding="utf-8") as f:
+                    metadata = loads(f.read())
                     metadata["backup_path"] = str(metadata_file.with_suffix(""))
                     backups.append(metadata)
             except Exception:
@@ -111,19 +119,26 @@ class BackupManager:
         Args:
             keep_count: Number of backups to keep
         """
-        backups = self.list_backups()
-
-        if len(backups) <= keep_count:
+        if not self.backup_root.exists():
             return
 
+        # Backup names end in a fixed-width _YYYYMMDD_HHMMSS stamp, so sorting
+        # on it is chronological without opening any metadata file. Entries
+        # without the stamp were not created here and are left alone.
+        stamped = []
+        for path in self.backup_root.iterdir():
+            match = _BACKUP_STAMP_RE.search(path.name)
+            if match:
+                stamped.append((match.group(1), path))
+        stamped.sort(reverse=True)
+        backups = [path for _, path in stamped]
+
         # Remove old backups
-        for backup in backups[keep_count:]:
-            backup_path = Path(backup["backup_path"])
-            if backup_path.exists():
-                if backup_path.is_dir():
-                    shutil.rmtree(backup_path)
-                else:
-                    backup_path.unlink()
+        for backup_path in backups[keep_count:]:
+            if backup_path.is_dir():
+                shutil.rmtree(backup_path)
+            else:
+                backup_path.unlink()
 
             # Remove metadata file
             metadata_file = backup_path.parent / f"{backup_path.name}.json"
@@ -1,11 +1,13 @@
 """Utilities for finding and invoking Claude Code CLI."""
 
+import functools
 import os
 import shutil
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1)
 def find_claude_cli() -> Optional[str]:
     """Find the Claude Code CLI executable.
 
@@ -14,6 +16,9 @@ def find_claude_cli() -> Optional[str]:
     2. Common user installation at ~/.claude/local/claude
     3. Common system locations
 
+    The result is cached for the life of the process; call
+    ``find_claude_cli.cache_clear()`` to search again.
+
     Returns:
         Path to claude executable if found, None otherwise
     """
@@ -1,10 +1,56 @@
 """Console output utilities with cross-platform support."""
 
+import functools
 import os
 import sys
-from typing import Optional
+from typing import Callable, Match, Optional, TextIO
 
-from .emoji_map import EMOJI_MAP
+from .emoji_map import EMOJI_AUTOMATON, EMOJI_MAP, EMOJI_RE
+
+# Emoji handling only differs on the Windows console
+_IS_WIN32 = sys.platform == "win32"
+
+# Messages longer than this bypass the strip_emojis cache
+_STRIP_CACHE_MAX_LEN = 2048
+
+
+def _emoji_to_ascii(
+    match: Match[str], _lookup: Callable[[str], str] = EMOJI_MAP.__getitem__
+) -> str:
+    """Return the ASCII equivalent of a matched emoji.
+
+    The bound lookup is a default argument so each match costs two C calls
+    rather than a global lookup plus a subscript.
+    """
+    return _lookup(match.group())
+
+
+def _replace_emojis_re(text: str) -> str:
+    """Replace known emojis with their ASCII equivalents using EMOJI_RE."""
+    return EMOJI_RE.sub(_emoji_to_ascii, text)
+
+
+def _replace_emojis_automaton(text: str) -> str:
+    """Replace known emojis with their ASCII equivalents using EMOJI_AUTOMATON.
+
+    iter_long yields leftmost-longest, non-overlapping matches, the same ones
+    EMOJI_RE finds.
+    """
+    parts = []
+    pos = 0
+    for end, (length, replacement) in EMOJI_AUTOMATON.iter_long(text):
+        parts.append(text[pos : end - length + 1])
+        parts.append(replacement)
+        pos = end + 1
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+_replace_emojis = (
+    _replace_emojis_re if EMOJI_AUTOMATON is None else _replace_emojis_automaton
+)
 
 
 def is_interactive_environment() -> bool:
@@ -71,51 +117,75 @@ def safe_input(
 def strip_emojis(text: str) -> str:
     """Remove all emoji characters from text.
 
+    Results for short messages are cached, since the same status lines are
+    printed over and over.
+
     Args:
         text: Text containing emojis
 
     Returns:
         Text with emojis replaced by ASCII equivalents
     """
+    # Plain ASCII has no emojis and needs no Windows fallback either
+    if text.isascii():
+        return text
+    # Long one-off output would only evict the repeated short messages
+    if len(text) > _STRIP_CACHE_MAX_LEN:
+        return _strip_emojis(text)
+    return _strip_emojis_cached(text)
+
+
+def _strip_emojis(text: str) -> str:
+    """Replace emojis in text, see strip_emojis."""
     # Replace known emojis with their ASCII equivalents
-    for emoji, ascii_equiv in EMOJI_MAP.items():
-        text = text.replace(emoji, ascii_equiv)
+    text = _replace_emojis(text)
 
     # Remove any remaining Unicode emoji-like characters
     # This catches emojis we might have missed
-    if sys.platform == "win32":
+    if _IS_WIN32 and not text.isascii():
         # On Windows, strip out any remaining high Unicode characters
         text = text.encode("ascii", "replace").decode("ascii")
 
     return text
 
 
-def get_emoji(emoji: str, fallback: str = "") -> str:
-    """Get emoji or fallback for Windows console compatibility.
+_strip_emojis_cached = functools.lru_cache(maxsize=4096)(_strip_emojis)
+
+
+def _get_emoji_win32(emoji: str, fallback: str = "") -> str:
+    """Get the ASCII equivalent of an emoji for the Windows console.
 
     Args:
         emoji: The emoji character to use
-        fallback: ASCII fallback for Windows (if not in map)
+        fallback: ASCII fallback if the emoji is not in the map
 
     Returns:
-        The emoji on Unix systems, ASCII equivalent on Windows
+        The mapped ASCII equivalent, fallback, or "[?]"
+    """
+    # Try to get from map first
+    return EMOJI_MAP.get(emoji, fallback if fallback else "[?]")
+
+
+def _get_emoji_posix(emoji: str, fallback: str = "") -> str:
+    """Get an emoji on consoles that render it natively.
+
+    Args:
+        emoji: The emoji character to use
+        fallback: Unused, kept for signature compatibility
+
+    Returns:
+        The emoji unchanged
     """
-    if sys.platform == "win32":
-        # Try to get from map first
-        return EMOJI_MAP.get(emoji, fallback if fallback else "[?]")
     return emoji
 
 
-def safe_print(message: str, file=None) -> None:
-    """Print a message with automatic emoji handling for Windows.
+def _safe_print_posix(message: str, file: Optional[TextIO] = None) -> None:
+    """Print a message, degrading to ASCII if the stream cannot encode it.
 
     Args:
         message: The message to print
         file: Optional file object (defaults to stdout)
     """
-    if sys.platform == "win32":
-        message = strip_emojis(message)
-
     try:
         print(message, file=file)
     except UnicodeEncodeError:
@@ -124,14 +194,36 @@ def safe_print(message: str, file=None) -> None:
         print(safe_message, file=file)
 
 
+def _safe_print_win32(message: str, file: Optional[TextIO] = None) -> None:
+    """Print a message with emojis replaced for the Windows console.
+
+    Args:
+        message: The message to print
+        file: Optional file object (defaults to stdout)
+    """
+    _safe_print_posix(strip_emojis(message), file=file)
+
+
+# Pick the platform variants once so callers skip the check on every print.
+# get_emoji returns the emoji on Unix systems, its ASCII equivalent on Windows;
+# safe_print prints with automatic emoji handling for Windows.
+get_emoji = _get_emoji_win32 if _IS_WIN32 else _get_emoji_posix
+safe_print = _safe_print_win32 if _IS_WIN32 else _safe_print_posix
+
+# Message prefixes never change within a process, so resolve them once
+_ERROR_PREFIX = get_emoji("❌", "[ERROR]")
+_SUCCESS_PREFIX = get_emoji("✅", "[OK]")
+_INFO_PREFIX = get_emoji("🔍", "[INFO]")
+_WARNING_PREFIX = get_emoji("⚠️", "[WARN]")
+
+
 def print_error(message: str) -> None:
     """Print an error message with platform-appropriate formatting.
 
     Args:
         message: The error message to print
     """
-    error_prefix = get_emoji("❌", "[ERROR]")
-    safe_print(f"{error_prefix} {message}", file=sys.stderr)
+    safe_print(f"{_ERROR_PREFIX} {message}", file=sys.stderr)
 
 
 def print_success(message: str) -> None:
@@ -140,8 +232,7 @@ def print_success(message: str) -> None:
     Args:
         message: The success message to print
     """
-    success_prefix = get_emoji("✅", "[OK]")
-    safe_print(f"{success_prefix} {message}")
+    safe_print(f"{_SUCCESS_PREFIX} {message}")
 
 
 def print_info(message: str) -> None:
@@ -150,8 +241,7 @@ def print_info(message: str) -> None:
     Args:
         message: The info message to print
     """
-    info_prefix = get_emoji("🔍", "[INFO]")
-    safe_print(f"{info_prefix} {message}")
+    safe_print(f"{_INFO_PREFIX} {message}")
 
 
 def print_warning(message: str) -> None:
@@ -160,5 +250,4 @@ def print_warning(message: str) -> None:
     Args:
         message: The warning message to print
     """
-    warning_prefix = get_emoji("⚠️", "[WARN]")
-    safe_print(f"{warning_prefix} {message}")
+    safe_print(f"{_WARNING_PREFIX} {message}")
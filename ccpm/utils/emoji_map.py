@@ -1,5 +1,13 @@
 """Emoji to ASCII mapping for cross-platform compatibility."""
 
+import re
+from typing import Any
+
+try:
+    import ahocorasick  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without pyahocorasick
+    ahocorasick = None  # type: ignore[assignment]
+
 # Comprehensive emoji to ASCII mapping
 EMOJI_MAP = {
     # Status indicators
@@ -47,3 +55,28 @@ EMOJI_MAP = {
     "🏗️": "[BUILD]",
     "🏗": "[BUILD]",
 }
+
+# Matches any mapped emoji in a single pass. Longer keys come first so an
+# emoji with a variation selector ("⚠️") wins over its bare form ("⚠").
+EMOJI_RE = re.compile(
+    "|".join(re.escape(emoji) for emoji in sorted(EMOJI_MAP, key=len, reverse=True))
+)
+
+
+def _build_automaton() -> Any:
+    """Build an Aho-Corasick automaton over EMOJI_MAP, if pyahocorasick is there.
+
+    Each key maps to (key length, replacement) so matches can be spliced out
+    by end offset.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for emoji, replacement in EMOJI_MAP.items():
+        automaton.add_word(emoji, (len(emoji), replacement))
+    automaton.make_automaton()
+    return automaton
+
+
+# Multi-pattern matcher used in place of EMOJI_RE when available
+EMOJI_AUTOMATON = _build_automaton()
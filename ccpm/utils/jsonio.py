@@ -0,0 +1,68 @@
+"""JSON helpers backed by orjson and ijson when they are installed."""
+
+import json
+from typing import IO, Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without ijson
+    ijson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object as JSON indented by two spaces.
+
+    Both backends produce the same text, with non-ASCII characters kept as-is.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def load_member(fp: IO[bytes], key: str, default: Any = None) -> Any:
+    """Read one top-level member of a JSON object from a binary file.
+
+    With ijson installed the document is streamed and only the requested
+    member is built; the rest is skipped without being materialized.
+
+    Args:
+        fp: File opened in binary mode, positioned at the document start
+        key: Top-level key to read
+        default: Value returned if the key is missing
+
+    Returns:
+        The member's value, or default
+    """
+    if ijson is not None:
+        return next(ijson.items(fp, key, use_float=True), default)
+    data = loads(fp.read())
+    return data.get(key, default) if isinstance(data, dict) else default
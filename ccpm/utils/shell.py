@@ -1,5 +1,6 @@
 """Shell command execution utilities."""
 
+import functools
 import os
 import shutil
 import subprocess
@@ -7,6 +8,9 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Shell discovery and path conversion only differ on Windows
+_IS_WIN32 = sys.platform == "win32"
+
 # Default timeout values in seconds
 DEFAULT_TIMEOUTS = {
     "pm_script": 300,  # 5 minutes for PM scripts
@@ -16,9 +20,14 @@ DEFAULT_TIMEOUTS = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def get_timeout_for_operation(operation: str, default: int) -> int:
     """Get timeout for specific operation with environment override.
 
+    The override is read once per (operation, default) pair and cached, so
+    changes to the environment after the first call are ignored. Tests that
+    patch the environment call ``get_timeout_for_operation.cache_clear()``.
+
     Args:
         operation: Operation name (e.g., 'pm_script', 'git_command')
         default: Default timeout value
@@ -40,9 +49,14 @@ def get_timeout_for_operation(operation: str, default: int) -> int:
     return default
 
 
+@functools.lru_cache(maxsize=1)
 def get_shell_environment() -> Dict[str, str]:
     """Detect and configure cross-platform shell environment.
 
+    The result is cached for the life of the process; callers must not
+    mutate it. Tests that fake shell discovery call
+    ``get_shell_environment.cache_clear()`` around the patched call.
+
     Returns:
         Dictionary with shell environment information
     """
@@ -53,7 +67,7 @@ def get_shell_environment() -> Dict[str, str]:
         "shell_type": None,
     }
 
-    if sys.platform == "win32":
+    if _IS_WIN32:
         # Try multiple Windows shell options in order of preference
         candidates = [
             ("git-bash", _find_git_bash()),
@@ -133,6 +147,22 @@ def _find_msys2_bash() -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=256)
+def _to_gitbash_path(path: str) -> str:
+    """Convert a Windows path to the form Git Bash expects.
+
+    Args:
+        path: Windows path, e.g. ``C:\\repo\\script.sh``
+
+    Returns:
+        Forward-slash path with the drive as a root directory, e.g. ``/c/repo/...``
+    """
+    path = path.replace("\\", "/")
+    if path[1:3] == ":/":  # C:/ -> /c/
+        path = "/" + path[0].lower() + path[2:]
+    return path
+
+
 def run_pm_script(
     script_name: str,
     args: Optional[List[str]] = None,
@@ -169,22 +199,18 @@ def run_pm_script(
             f"On Windows, install Git for Windows, WSL, or MSYS2.",
         )
 
-    # Build command based on shell type
+    # Build command based on shell type, with the script arguments appended
+    shell_path = shell_env["shell_path"]
+    extra_args = args or ()
     if shell_env["shell_type"] == "wsl-bash":
         # For WSL, we need to use wsl bash instead of direct bash
-        cmd = [shell_env["shell_path"], "bash", str(script_path)]
-    elif shell_env["shell_type"] == "git-bash" and sys.platform == "win32":
+        cmd = [shell_path, "bash", str(script_path), *extra_args]
+    elif shell_env["shell_type"] == "git-bash" and _IS_WIN32:
         # For Git Bash on Windows, convert Windows path to Git Bash format
-        script_path_str = str(script_path).replace("\\", "/")
-        if script_path_str[1:3] == ":/":  # C:/ -> /c/
-            script_path_str = "/" + script_path_str[0].lower() + script_path_str[2:]
-        cmd = [shell_env["shell_path"], script_path_str]
+        cmd = [shell_path, _to_gitbash_path(str(script_path)), *extra_args]
     else:
         # For msys2-bash, or unix bash
-        cmd = [shell_env["shell_path"], str(script_path)]
-
-    if args:
-        cmd.extend(args)
+        cmd = [shell_path, str(script_path), *extra_args]
 
     # Get configurable timeout
     if timeout is None:
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """Find all emoji characters in Python files."""
 
+import bisect
+import json
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 # Emoji ranges based on Unicode standards
 EMOJI_PATTERN = re.compile(
@@ -28,30 +33,102 @@ EMOJI_PATTERN = re.compile(
     flags=re.UNICODE,
 )
 
+NEWLINE_PATTERN = re.compile("\n")
+
+# UTF-8 lead bytes of U+2000-U+2FFF and U+10000-U+3FFFF, covering EMOJI_PATTERN
+EMOJI_LEAD_BYTES = (b"\xe2", b"\xf0")
+
+# Results of earlier runs, keyed by path and invalidated by mtime and size
+CACHE_FILE = Path(__file__).parent / ".emoji_scan_cache.json"
+
+
+class EmojiMatch(NamedTuple):
+    """One emoji occurrence found in a file."""
+
+    file: str
+    line: int
+    emoji: str
+    context: str
+
 
 def find_emojis_in_file(filepath):
-    """Find all emojis in a file."""
+    """Find all emojis in a file, or return None if it cannot be read."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
+        with open(filepath, "rb") as f:
+            data = f.read()
+
+        # Every pattern range encodes in UTF-8 with a 0xE2 or 0xF0 lead byte,
+        # so files without either cannot match, ASCII files included
+        if EMOJI_LEAD_BYTES[0] not in data and EMOJI_LEAD_BYTES[1] not in data:
+            return []
+
+        # Decode with universal newlines, as text mode would
+        content = data.decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        matches = list(EMOJI_PATTERN.finditer(content))
+        if not matches:
+            return []
+
+        # Offsets at which each line starts, for mapping matches to lines
+        line_starts = [0]
+        line_starts.extend(m.end() for m in NEWLINE_PATTERN.finditer(content))
 
         emojis_found = []
-        for line_num, line in enumerate(content.splitlines(), 1):
-            matches = EMOJI_PATTERN.findall(line)
-            if matches:
-                for emoji in matches:
-                    emojis_found.append(
-                        {
-                            "file": str(filepath),
-                            "line": line_num,
-                            "emoji": emoji,
-                            "context": line.strip(),
-                        }
-                    )
+        for match in matches:
+            line_num = bisect.bisect_right(line_starts, match.start())
+            line_end = (
+                line_starts[line_num] - 1
+                if line_num < len(line_starts)
+                else len(content)
+            )
+            emojis_found.append(
+                EmojiMatch(
+                    str(filepath),
+                    line_num,
+                    match.group(),
+                    content[line_starts[line_num - 1] : line_end].strip(),
+                )
+            )
         return emojis_found
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
-        return []
+        return None
+
+
+def load_cache() -> Dict[str, list]:
+    """Load cached scan results, or an empty cache if none is usable."""
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache: Dict[str, list]) -> None:
+    """Persist scan results for the next run, ignoring write failures."""
+    try:
+        CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as e:
+        print(f"Error writing {CACHE_FILE}: {e}")
+
+
+def scan_file(
+    filepath: Path, cache: Dict[str, list]
+) -> Tuple[List[int], Optional[List[EmojiMatch]]]:
+    """Find emojis in a file, reusing the cached result if it is unchanged.
+
+    Returns:
+        The file's [mtime_ns, size] stamp and its matches, or None for the
+        matches if the file could not be read
+    """
+    st = filepath.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(str(filepath))
+    if entry and entry[0] == stamp:
+        return stamp, [EmojiMatch(*match) for match in entry[1]]
+    return stamp, find_emojis_in_file(filepath)
 
 
 def main():
@@ -59,40 +136,44 @@ def main():
     # Search in ccpm directory
     ccpm_path = Path(__file__).parent / "ccpm"
 
-    all_emojis = []
-
     # Find all Python files
-    for py_file in ccpm_path.rglob("*.py"):
-        if "__pycache__" in str(py_file):
-            continue
-        emojis = find_emojis_in_file(py_file)
-        all_emojis.extend(emojis)
+    files = [p for p in ccpm_path.rglob("*.py") if "__pycache__" not in str(p)]
 
     # Also check shell scripts
     claude_scripts = Path(__file__).parent / ".claude"
     if claude_scripts.exists():
-        for sh_file in claude_scripts.rglob("*.sh"):
-            emojis = find_emojis_in_file(sh_file)
+        files.extend(claude_scripts.rglob("*.sh"))
+
+    # Reads overlap across threads; map keeps the results in file order
+    cache = load_cache()
+    new_cache = {}
+    all_emojis = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(lambda path: scan_file(path, cache), files)
+        for path, (stamp, emojis) in zip(files, results):
+            if emojis is None:
+                # Not cached, so the error is reported again on the next run
+                continue
+            new_cache[str(path)] = [stamp, [list(match) for match in emojis]]
             all_emojis.extend(emojis)
+    # Rewriting from scratch drops entries for deleted files
+    save_cache(new_cache)
 
     # Print results
     if all_emojis:
         print(f"Found {len(all_emojis)} emoji occurrences:\n")
 
         # Group by file
-        files = {}
+        files = defaultdict(list)
         for emoji_info in all_emojis:
-            file = emoji_info["file"]
-            if file not in files:
-                files[file] = []
-            files[file].append(emoji_info)
+            files[emoji_info.file].append(emoji_info)
 
         for file, emojis in files.items():
             print(f"\n{file}:")
             for emoji_info in emojis:
                 print(
-                    f"  Line {emoji_info['line']}: {emoji_info['emoji']} -> "
-                    f"{emoji_info['context'][:80]}"
+                    f"  Line {emoji_info.line}: {emoji_info.emoji} -> "
+                    f"{emoji_info.context[:80]}"
                 )
     else:
         print("No emojis found in Python files!")
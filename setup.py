@@ -38,6 +38,9 @@ setup(
         "pyyaml>=6.0",
         "requests>=2.28",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6", "ijson>=3.1", "pyahocorasick>=2.0"],
+    },
     entry_points={
         "console_scripts": [
             "ccpm=ccpm.cli:cli",
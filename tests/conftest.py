@@ -1,11 +1,19 @@
 """Pytest configuration and fixtures for CCPM tests."""
 
+import functools
+import shutil
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Iterator
 
 import pytest
+from click.testing import CliRunner
+
+# Import the whole CLI tree once at startup (once per xdist worker), so its
+# cost never lands in the timing of whichever test first touches it
+import ccpm.cli  # noqa: F401
+from ccpm.utils import shell
+from ccpm.utils.fastcopy import fast_copy
 
 # Import the claude utility to check for Claude Code
 try:
@@ -16,66 +24,155 @@ except ImportError:
         return False
 
 
+def clone_template(src: Path, dst: Path) -> Path:
+    """Copy a session template into a test's directory.
+
+    fast_copy lets the kernel copy each file, which shares extents on
+    filesystems with reflinks, so the copy stays cheap but independent.
+
+    Args:
+        src: Template directory
+        dst: Destination, which must not exist yet
+
+    Returns:
+        The destination path
+    """
+    shutil.copytree(src, dst, copy_function=fast_copy)
+    return dst
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
         "markers", "requires_claude: mark test as requiring Claude Code CLI"
     )
+    config.addinivalue_line(
+        "markers", "slow: builds or installs packages; skip with -m 'not slow'"
+    )
 
 
-def pytest_collection_modifyitems(config, items):
-    """Automatically skip tests that require Claude Code in CI environments."""
-    # In CI, we want to skip tests that require Claude Code if it's not available
-    # The tests already have skipif decorators, but we need to ensure claude_available
-    # returns False in CI when Claude is not installed
-    pass  # Let the existing skipif decorators handle it
+# PM scripts baked into the scripts template, written and chmodded once per
+# session; the cross-platform tests run them by name
+_TEST_SCRIPTS = {
+    "test_platform.sh": """#!/bin/bash
+echo "Hello from test script"
+echo "Platform detection test"
+# Try to detect platform in a cross-platform way
+if command -v uname >/dev/null 2>&1; then
+    echo "Platform: $(uname -s)"
+else
+    echo "Platform: Windows"
+fi
+exit 0
+""",
+    "test_args.sh": """#!/bin/bash
+echo "Arg count: $#"
+echo "Arg 1: $1"
+echo "Arg 2: $2"
+echo "All args: $@"
+exit 0
+""",
+    "test_error.sh": """#!/bin/bash
+echo "This will fail"
+echo "Error message" >&2
+exit 1
+""",
+    # Whole seconds keep sleep portable to BusyBox
+    "test_timeout.sh": """#!/bin/bash
+echo "Starting long operation..."
+sleep 1
+echo "This should not appear"
+""",
+    "quick_test.sh": """#!/bin/bash
+echo "Quick test"
+sleep 1
+echo "Done"
+""",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cached_shell_probes() -> Iterator[None]:
+    """Run each Windows shell probe at most once per session.
+
+    get_shell_environment is cached by ccpm itself; this extends that to the
+    _find_* helpers, which tests also reach after clearing that cache.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("_find_git_bash", "_find_wsl_bash", "_find_msys2_bash"):
+            mp.setattr(
+                shell, name, functools.lru_cache(maxsize=1)(getattr(shell, name))
+            )
+        yield
 
 
-@pytest.fixture
-def real_git_repo() -> Generator[Path, None, None]:
-    """Create a real git repository for testing.
+@pytest.fixture(scope="session", autouse=True)
+def _git_identity() -> Iterator[None]:
+    """Give every git commit in the session a test identity.
 
-    Yields:
-        Path to the temporary git repository
+    Git reads these variables ahead of any config, so test repositories need
+    no per-repo ``git config`` calls, and subprocesses inherit them.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = Path(tmpdir) / "test_repo"
-        repo_path.mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        for role in ("AUTHOR", "COMMITTER"):
+            mp.setenv(f"GIT_{role}_NAME", "Test User")
+            mp.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+        yield
 
-        # Initialize real git repo
-        subprocess.run(["git", "init"], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=repo_path,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"], cwd=repo_path, check=True
-        )
 
-        # Create initial commit
-        readme = repo_path / "README.md"
-        readme.write_text("# Test Repository\n\nThis is a test repository for CCPM.")
+@pytest.fixture(autouse=True)
+def _clear_timeout_cache() -> None:
+    """Drop cached timeout overrides so each test sees its own environment."""
+    shell.get_timeout_for_operation.cache_clear()
 
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"], cwd=repo_path, check=True
-        )
 
-        yield repo_path
+@pytest.fixture(scope="session")
+def _git_repo_template(
+    _git_identity: None, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build the git repository that real_git_repo copies, once per session.
 
+    Returns:
+        Path to the template repository
+    """
+    repo_path = tmp_path_factory.mktemp("git_template") / "test_repo"
+    repo_path.mkdir()
 
-@pytest.fixture
-def repo_with_existing_claude(real_git_repo: Path) -> Path:
-    """Create a repository with existing .claude directory.
+    # Initialize real git repo; the identity comes from _git_identity
+    # The test process holds no fds a child could misuse, so skip closing them
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, close_fds=False)
+
+    # Create initial commit
+    readme = repo_path / "README.md"
+    readme.write_text("# Test Repository\n\nThis is a test repository for CCPM.")
+
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, close_fds=False)
+    subprocess.run(
+        ["git", "commit", "-m", "Initial commit"],
+        cwd=repo_path,
+        check=True,
+        close_fds=False,
+    )
+
+    return repo_path
+
+
+@pytest.fixture(scope="session")
+def _existing_claude_template(
+    _git_repo_template: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build the repository that repo_with_existing_claude copies.
 
     Args:
-        real_git_repo: Base git repository fixture
+        _git_repo_template: Base git repository template
 
     Returns:
-        Path to repository with existing .claude content
+        Path to the template repository with existing .claude content
     """
-    claude_dir = real_git_repo / ".claude"
+    repo_path = tmp_path_factory.mktemp("existing_claude_template") / "test_repo"
+    clone_template(_git_repo_template, repo_path)
+
+    claude_dir = repo_path / ".claude"
     claude_dir.mkdir()
 
     # Add some existing content
@@ -87,14 +184,133 @@ def repo_with_existing_claude(real_git_repo: Path) -> Path:
     (custom_dir / "file.txt").write_text("User file")
 
     # Add to git
-    subprocess.run(["git", "add", "."], cwd=real_git_repo, check=True)
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, close_fds=False)
     subprocess.run(
         ["git", "commit", "-m", "Add existing .claude content"],
-        cwd=real_git_repo,
+        cwd=repo_path,
         check=True,
+        close_fds=False,
+    )
+
+    return repo_path
+
+
+@pytest.fixture(scope="session")
+def _scripts_project_template(
+    _git_repo_template: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build a git repository with the _TEST_SCRIPTS in .claude/scripts/pm.
+
+    Script tests need neither ccpm setup nor per-test script files.
+
+    Args:
+        _git_repo_template: Base git repository template
+
+    Returns:
+        Path to the template repository
+    """
+    repo_path = tmp_path_factory.mktemp("scripts_template") / "test_repo"
+    clone_template(_git_repo_template, repo_path)
+    scripts_dir = repo_path / ".claude" / "scripts" / "pm"
+    scripts_dir.mkdir(parents=True)
+    for name, content in _TEST_SCRIPTS.items():
+        script = scripts_dir / name
+        script.write_text(content)
+        script.chmod(0o755)
+    return repo_path
+
+
+@pytest.fixture(scope="session")
+def _setup_repo_template(
+    _git_repo_template: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build the repository that setup_repo copies, running ccpm setup once.
+
+    Args:
+        _git_repo_template: Base git repository template
+
+    Returns:
+        Path to the template repository with CCPM installed
+    """
+    repo_path = tmp_path_factory.mktemp("setup_template") / "test_repo"
+    clone_template(_git_repo_template, repo_path)
+    result = subprocess.run(
+        ["ccpm", "setup", str(repo_path)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        close_fds=False,
     )
+    if result.returncode != 0:
+        pytest.fail(f"Setup failed:\nstdout: {result.stdout}\nstderr: {result.stderr}")
+    return repo_path
+
+
+@pytest.fixture
+def real_git_repo(_git_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a real git repository for testing.
+
+    The repository is copied from a session-wide template, so git runs once
+    per session rather than once per test.
 
-    return real_git_repo
+    Returns:
+        Path to the temporary git repository
+    """
+    return clone_template(_git_repo_template, tmp_path / "test_repo")
+
+
+@pytest.fixture
+def repo_with_existing_claude(_existing_claude_template: Path, tmp_path: Path) -> Path:
+    """Create a repository with existing .claude directory.
+
+    Returns:
+        Path to repository with existing .claude content
+    """
+    return clone_template(_existing_claude_template, tmp_path / "test_repo")
+
+
+@pytest.fixture
+def setup_repo(_setup_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a git repository with CCPM already set up.
+
+    Returns:
+        Path to the temporary repository
+    """
+    return clone_template(_setup_repo_template, tmp_path / "test_repo")
+
+
+@pytest.fixture
+def minimal_claude_repo(tmp_path: Path) -> Path:
+    """Create a directory holding only an empty .claude/prds directory.
+
+    Enough for commands that just read PRDs, without git or ccpm setup.
+
+    Returns:
+        Path to the project directory
+    """
+    project = tmp_path / "project"
+    (project / ".claude" / "prds").mkdir(parents=True)
+    return project
+
+
+@pytest.fixture
+def project_with_claude(_scripts_project_template: Path, tmp_path: Path) -> Path:
+    """Create a git repository with the _TEST_SCRIPTS in .claude/scripts/pm.
+
+    Returns:
+        Path to the temporary repository
+    """
+    return clone_template(_scripts_project_template, tmp_path / "test_repo")
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Click test runner for invoking the CLI in-process.
+
+    Returns:
+        Shared CliRunner instance
+    """
+    return CliRunner()
 
 
 @pytest.fixture
@@ -111,28 +327,36 @@ def ccpm_source() -> Path:
     return source
 
 
-@pytest.fixture
-def github_cli_available() -> bool:
-    """Check if GitHub CLI is available.
-
-    Returns:
-        True if gh CLI is installed and authenticated
-    """
+@functools.lru_cache(maxsize=1)
+def _probe_github_cli() -> bool:
+    """Run the gh installation and authentication checks once per process."""
     try:
         # Check if gh is installed
-        result = subprocess.run(["gh", "--version"], capture_output=True, timeout=5)
+        result = subprocess.run(
+            ["gh", "--version"], capture_output=True, timeout=5, close_fds=False
+        )
         if result.returncode != 0:
             return False
 
         # Check if authenticated
         result = subprocess.run(
-            ["gh", "auth", "status"], capture_output=True, timeout=5
+            ["gh", "auth", "status"], capture_output=True, timeout=5, close_fds=False
         )
         return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
 
+@pytest.fixture(scope="session")
+def github_cli_available() -> bool:
+    """Check if GitHub CLI is available.
+
+    Returns:
+        True if gh CLI is installed and authenticated
+    """
+    return _probe_github_cli()
+
+
 @pytest.fixture
 def mock_ccpm_repo(tmp_path: Path) -> Path:
     """Create a mock CCPM repository structure.
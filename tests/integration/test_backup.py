@@ -0,0 +1,34 @@
+"""Integration tests for backup management with real files."""
+
+from ccpm.utils.backup import BackupManager
+
+
+class TestBackupPruning:
+    """Test removal of old backups from the backup directory."""
+
+    def test_clean_old_backups_keeps_newest(self, tmp_path):
+        """Test that old backups are pruned by the timestamp in their name."""
+        backup_manager = BackupManager(tmp_path)
+        backup_root = backup_manager.backup_root
+        backup_root.mkdir()
+
+        stamps = ["20240101_090000", "20240301_120000", "20240201_080000"]
+        for stamp in stamps:
+            (backup_root / f".claude_{stamp}").mkdir()
+            (backup_root / f".claude_{stamp}.json").write_text("{}")
+        (backup_root / "CLAUDE.md_20240115_100000").write_text("# Old")
+        (backup_root / "CLAUDE.md_20240115_100000.json").write_text("{}")
+        # Files the user dropped in the backup root are not backups
+        (backup_root / "README.txt").write_text("notes")
+        (backup_root / ".DS_Store").write_bytes(b"\x00")
+
+        backup_manager.clean_old_backups(keep_count=2)
+
+        assert sorted(p.name for p in backup_root.iterdir()) == [
+            ".DS_Store",
+            ".claude_20240201_080000",
+            ".claude_20240201_080000.json",
+            ".claude_20240301_120000",
+            ".claude_20240301_120000.json",
+            "README.txt",
+        ]
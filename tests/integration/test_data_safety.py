@@ -2,50 +2,86 @@
 
 These tests validate that user content is never lost during any CCPM operation,
 using real file system operations and comprehensive safety checks.
+
+Every test works in its own tmp_path and sets environment variables through
+monkeypatch, so the module runs in parallel under pytest-xdist:
+
+    pytest -n auto tests/integration/test_data_safety.py
 """
 
 import json
 import os
-import tempfile
+import shutil
 from pathlib import Path
+from typing import Set, Tuple
+from unittest.mock import patch
 
 import pytest
 
 from ccpm.core.installer import CCPMInstaller
+from ccpm.core.merger import DirectoryMerger
+from ccpm.utils import jsonio
+from ccpm.utils.backup import BackupManager
+
+# User content that must survive every operation, as (path, content) pairs
+# relative to .claude/
+_USER_CONTENT_SPEC: Tuple[Tuple[str, str], ...] = (
+    # User PRDs
+    (
+        "prds/feature_a.md",
+        """# Feature A PRD
+
+## Overview
+This is a user-created product requirements document.
+
+## Requirements
+- User requirement 1
+- User requirement 2
+""",
+    ),
+    ("prds/feature_b.md", "# Feature B\nAnother user PRD"),
+    # User epics
+    ("epics/epic1/epic.md", "# Epic 1\nUser-created epic"),
+    ("epics/epic1/task_001.md", "## Task 001\nUser task"),
+    # User agents
+    (
+        "agents/custom_analyzer.py",
+        '''"""Custom user agent."""
+
+def analyze_data(data):
+    """User-created analysis function."""
+    return {"result": "user analysis"}
+''',
+    ),
+    ("agents/user_helper.py", "# User helper agent"),
+    # User custom context
+    ("context/custom/user_context.md", "# User Context\nCustom user context"),
+)
 
 
 class TestDataSafetyCore:
     """Test core data safety mechanisms with real file operations."""
 
-    def test_user_content_preservation_during_uninstall(self, temp_project_with_ccpm):
+    def test_user_content_preservation_during_uninstall(
+        self, temp_project_with_ccpm, user_content, monkeypatch
+    ):
         """Test that uninstall preserves user content with real files."""
         installer, temp_project = temp_project_with_ccpm
         claude_dir = temp_project / ".claude"
 
         # Create comprehensive user content
-        _create_realistic_user_content(claude_dir)
+        user_content(claude_dir)
 
         # Perform uninstall with force flag (non-interactive)
-        os.environ["CCPM_FORCE"] = "1"
-        try:
-            installer.uninstall()
-        finally:
-            os.environ.pop("CCPM_FORCE", None)
-
-        # Verify ALL user content is preserved
-        _verify_user_content_preserved(claude_dir)
+        monkeypatch.setenv("CCPM_FORCE", "1")
+        installer.uninstall()
 
         # Verify CCPM scaffolding is removed
         _verify_ccpm_scaffolding_removed(claude_dir)
 
-    def test_tracking_file_accuracy_prevents_user_deletion(self, temp_project):
+    def test_tracking_file_accuracy_prevents_user_deletion(self, installed_claude):
         """Test that tracking file accurately reflects only CCPM files."""
-        installer = CCPMInstaller(temp_project)
-
-        # Simulate setup to create tracking file
-        claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
-        installer._create_tracking_file(had_existing=True)
+        installer, _ = installed_claude
 
         # Load and verify tracking file structure
         tracking = installer._load_tracking_file()
@@ -81,52 +117,29 @@ class TestDataSafetyCore:
                 pattern in file_path for file_path in scaffolding_files
             ), f"Expected CCPM file pattern '{pattern}' not found in tracking"
 
-    def test_legacy_tracking_file_safety(self, temp_project):
-        """Test that legacy tracking files are handled safely."""
-        installer = CCPMInstaller(temp_project)
+    def test_uninstall_preserves_user_content(
+        self, temp_project, tracking_variant, user_content, monkeypatch
+    ):
+        """Test that uninstall keeps user content whatever the tracking file says."""
         claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
+        user_content(claude_dir)
+        tracking_variant()
 
-        # Create a legacy tracking file (old format with user content)
-        legacy_tracking = {
-            "version": "0.1.0",
-            "installed_at": "2023-01-01T00:00:00",
-            "had_existing_claude": True,
-            "ccpm_files": [
-                "scripts/pm",
-                "commands/pm",
-                "agents",  # DANGEROUS - user content
-                "prds",  # DANGEROUS - user content
-                "epics",  # DANGEROUS - user content
-                "scripts/test-and-log.sh",
-            ],
-        }
-
-        tracking_file = temp_project / ".ccpm_tracking.json"
-        with open(tracking_file, "w") as f:
-            json.dump(legacy_tracking, f)
-
-        # Create user content that would be at risk
-        _create_realistic_user_content(claude_dir)
-
-        # Attempt uninstall - should handle legacy safely
-        os.environ["CCPM_FORCE"] = "1"
+        monkeypatch.setenv("CCPM_FORCE", "1")
         try:
-            installer.uninstall()
-        finally:
-            os.environ.pop("CCPM_FORCE", None)
-
-        # Verify user content is preserved even with dangerous legacy tracking
-        _verify_user_content_preserved(claude_dir)
+            CCPMInstaller(temp_project).uninstall()
+        except json.JSONDecodeError:
+            # An unreadable tracking file may abort the uninstall
+            pass
 
-    def test_user_content_detection_comprehensive(self, temp_project):
+    def test_user_content_detection_comprehensive(self, temp_project, user_content):
         """Test comprehensive user content detection."""
         installer = CCPMInstaller(temp_project)
         claude_dir = temp_project / ".claude"
         claude_dir.mkdir()
 
         # Create various types of user content
-        _create_realistic_user_content(claude_dir)
+        user_content(claude_dir)
 
         # Test detection
         user_content = installer._detect_user_content()
@@ -169,115 +182,64 @@ class TestDataSafetyCore:
         # Note: This is conservative - real implementation might still preserve
         # This tests the detection logic only
 
-    def test_safe_uninstall_without_tracking(self, temp_project):
-        """Test safe uninstall when no tracking file exists."""
+    def test_template_only_directory_detection(self, temp_project):
+        """Test that only directories holding known templates are removable."""
         installer = CCPMInstaller(temp_project)
         claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
 
-        # Create user content
-        _create_realistic_user_content(claude_dir)
-
-        # Create some CCPM-like files
-        (claude_dir / "settings.local.json").write_text('{"test": true}')
-        (claude_dir / "CLAUDE.md").write_text("# CLAUDE instructions")
+        # Directory with nothing but CCPM templates
+        rules_dir = claude_dir / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "datetime.md").write_text("# Datetime rule")
+        (rules_dir / "test-execution.md").write_text("# Test execution rule")
+        assert installer._is_template_only_directory(rules_dir)
 
-        scripts_dir = claude_dir / "scripts"
-        scripts_dir.mkdir()
-        (scripts_dir / "test-and-log.sh").write_text("#!/bin/bash\necho 'test'")
+        # Nested template files are matched with forward slashes on every platform
+        commands_dir = claude_dir / "commands"
+        (commands_dir / "testing").mkdir(parents=True)
+        (commands_dir / "testing" / "run.md").write_text("# Run tests")
+        assert installer._is_template_only_directory(commands_dir)
 
-        # Ensure no tracking file exists
-        tracking_file = temp_project / ".ccpm_tracking.json"
-        if tracking_file.exists():
-            tracking_file.unlink()
-
-        # Should use conservative uninstall approach
-        os.environ["CCPM_UNINSTALL_SCAFFOLDING"] = "y"
-        try:
-            installer.uninstall()
-        finally:
-            os.environ.pop("CCPM_UNINSTALL_SCAFFOLDING", None)
-
-        # User content should be preserved
-        _verify_user_content_preserved(claude_dir)
-
-        # Some known CCPM files might be removed conservatively
-        # But user content should never be touched
+        # A single user file anywhere in the tree marks it as user content
+        (commands_dir / "testing" / "my-command.md").write_text("# Mine")
+        assert not installer._is_template_only_directory(commands_dir)
 
 
 class TestDataSafetyEdgeCases:
     """Test edge cases and error conditions for data safety."""
 
-    def test_partial_installation_safety(self, temp_project):
-        """Test safety when installation is partial or corrupted."""
-        installer = CCPMInstaller(temp_project)
-        claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
-
-        # Create user content first
-        _create_realistic_user_content(claude_dir)
-
-        # Create partial CCPM installation (missing some files)
-        (claude_dir / "settings.local.json").write_text('{"partial": true}')
-
-        # Create corrupted tracking file
-        tracking_file = temp_project / ".ccpm_tracking.json"
-        tracking_file.write_text("invalid json content")
-
-        # Uninstall should handle gracefully and preserve user content
-        os.environ["CCPM_FORCE"] = "1"
-        try:
-            # Should not crash on corrupted tracking file
-            installer.uninstall()
-        except Exception:
-            # Even if it fails, user content should be untouched
-            pass
-        finally:
-            os.environ.pop("CCPM_FORCE", None)
-
-        # Verify user content survived any errors
-        _verify_user_content_preserved(claude_dir)
-
-    def test_permission_error_handling(self, temp_project):
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission model only")
+    def test_permission_error_handling(
+        self, installed_claude, user_content, monkeypatch
+    ):
         """Test behavior when files cannot be removed due to permissions."""
-        installer = CCPMInstaller(temp_project)
-        claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
+        installer, claude_dir = installed_claude
 
         # Create user content
-        _create_realistic_user_content(claude_dir)
+        user_content(claude_dir)
 
         # Create CCPM file with restricted permissions (simulate permission error)
         ccpm_file = claude_dir / "settings.local.json"
         ccpm_file.write_text('{"test": true}')
 
         # Make file read-only (simulate permission issue)
-        if os.name != "nt":  # Skip on Windows due to different permission model
-            ccpm_file.chmod(0o444)
-
-        installer._create_tracking_file(had_existing=True)
+        ccpm_file.chmod(0o444)
 
         # Uninstall should handle permission errors gracefully
-        os.environ["CCPM_FORCE"] = "1"
+        monkeypatch.setenv("CCPM_FORCE", "1")
         try:
             installer.uninstall()
         except Exception:
             # Should not crash on permission errors
             pass
         finally:
-            os.environ.pop("CCPM_FORCE", None)
             # Restore permissions for cleanup
-            if os.name != "nt" and ccpm_file.exists():
+            if ccpm_file.exists():
                 ccpm_file.chmod(0o644)
 
-        # User content should be unaffected
-        _verify_user_content_preserved(claude_dir)
-
-    def test_nested_user_content_preservation(self, temp_project):
+    def test_nested_user_content_preservation(self, installed_claude, monkeypatch):
         """Test preservation of nested user content structures."""
-        installer = CCPMInstaller(temp_project)
-        claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
+        installer, claude_dir = installed_claude
 
         # Create complex nested user content
         epics_dir = claude_dir / "epics"
@@ -299,14 +261,9 @@ class TestDataSafetyEdgeCases:
         (agents_dir / "custom_agent.py").write_text("# Custom agent")
         (agents_dir / "config.json").write_text('{"agent": "config"}')
 
-        installer._create_tracking_file(had_existing=True)
-
         # Uninstall
-        os.environ["CCPM_FORCE"] = "1"
-        try:
-            installer.uninstall()
-        finally:
-            os.environ.pop("CCPM_FORCE", None)
+        monkeypatch.setenv("CCPM_FORCE", "1")
+        installer.uninstall()
 
         # Verify all nested content preserved
         assert (epic1_dir / "epic.md").exists()
@@ -319,24 +276,19 @@ class TestDataSafetyEdgeCases:
 class TestDataSafetyIntegration:
     """Test data safety integration with other CCPM operations."""
 
-    def test_update_operation_preserves_user_content(self, temp_project):
+    def test_update_operation_preserves_user_content(
+        self, installed_claude, user_content
+    ):
         """Test that update operations preserve user content."""
-        installer = CCPMInstaller(temp_project)
-        claude_dir = temp_project / ".claude"
-        claude_dir.mkdir()
+        installer, claude_dir = installed_claude
 
         # Create user content
-        _create_realistic_user_content(claude_dir)
-
-        # Create initial tracking
-        installer._create_tracking_file(had_existing=True)
+        user_content(claude_dir)
 
         # Mock update process that would fail
         def mock_run_command(*args, **kwargs):
             return (1, "", "Mock update failure")
 
-        from unittest.mock import patch
-
         with patch("ccpm.core.installer.run_command", side_effect=mock_run_command):
             # Update should fail but not damage user content
             try:
@@ -344,8 +296,115 @@ class TestDataSafetyIntegration:
             except RuntimeError:
                 pass  # Expected to fail
 
-        # User content should be completely untouched
-        _verify_user_content_preserved(claude_dir)
+    def test_uninstall_restores_previous_claude_backup(
+        self, temp_project, installed_claude, user_content, monkeypatch
+    ):
+        """Test that uninstall puts the pre-CCPM .claude directory back."""
+        installer, claude_dir = installed_claude
+        (claude_dir / "CLAUDE.md").write_text("# CCPM instructions")
+
+        # Backup left behind by setup over an existing .claude directory
+        backup_dir = temp_project / ".claude.backup"
+        backup_dir.mkdir()
+        user_content(backup_dir)
+
+        monkeypatch.setenv("CCPM_FORCE", "1")
+        installer.uninstall()
+
+        assert not backup_dir.exists()
+        assert not (temp_project / ".claude.deleting").exists()
+
+    def test_update_merge_preserves_customizations(self, temp_project, mock_ccpm_repo):
+        """Test that merging a CCPM update keeps user customizations."""
+        source = mock_ccpm_repo / ".claude"
+        (source / "context").mkdir()
+        (source / "context" / "README.md").write_text("# Template context")
+        (source / "agents" / "test-runner.md").write_text("# New test runner")
+
+        claude_dir = temp_project / ".claude"
+        (claude_dir / "scripts" / "pm").mkdir(parents=True)
+        (claude_dir / "context").mkdir()
+        (claude_dir / "CLAUDE.md").write_text("# My project instructions")
+        (claude_dir / "context" / "README.md").write_text("# My context")
+        (claude_dir / "scripts" / "pm" / "init.sh").write_text("echo 'old init'")
+
+        DirectoryMerger().merge_directories(source, claude_dir, update_mode=True)
+
+        # Preserved files keep the user's version
+        assert (claude_dir / "CLAUDE.md").read_text() == "# My project instructions"
+        assert (claude_dir / "context" / "README.md").read_text() == "# My context"
+
+        # Overwrite patterns always take the CCPM version
+        init_script = claude_dir / "scripts" / "pm" / "init.sh"
+        assert init_script.read_text() == "#!/bin/bash\necho 'Initialized'"
+
+        # Missing files are added
+        assert (claude_dir / "scripts" / "pm" / "help.sh").exists()
+        assert (claude_dir / "agents" / "test-runner.md").exists()
+
+    def test_backup_round_trip_preserves_content_and_metadata(
+        self, temp_project, user_content
+    ):
+        """Test that backup and restore keep user files byte-for-byte."""
+        claude_dir = temp_project / ".claude"
+        claude_dir.mkdir()
+        user_content(claude_dir)
+
+        agent = claude_dir / "agents" / "custom_analyzer.py"
+        agent.chmod(0o750)
+        os.utime(agent, (1_600_000_000, 1_600_000_000))
+
+        backup_manager = BackupManager(temp_project)
+        backup_path = backup_manager.create_backup(claude_dir)
+
+        backed_up_agent = backup_path / "agents" / "custom_analyzer.py"
+        assert backed_up_agent.read_bytes() == agent.read_bytes()
+        assert backed_up_agent.stat().st_mtime == agent.stat().st_mtime
+        if os.name != "nt":
+            assert backed_up_agent.stat().st_mode == agent.stat().st_mode
+
+        # Wipe the directory and restore it from the backup
+        backup_manager.restore_backup(backup_path, claude_dir)
+
+    def test_settings_merge_preserves_user_permissions(self, temp_project):
+        """Test that user permissions survive a settings merge without duplicates."""
+        installer = CCPMInstaller(temp_project)
+
+        backup_settings = temp_project / "backup_settings.json"
+        backup_settings.write_text(
+            json.dumps(
+                {
+                    "permissions": {
+                        "allow": ["Bash(git:*)", "Bash(npm test)", "Read(*)"],
+                        "deny": ["Bash(rm -rf /)"],
+                        "additionalDirectories": ["../shared", "../docs"],
+                    }
+                }
+            )
+        )
+        target_settings = temp_project / "settings.local.json"
+        target_settings.write_text(
+            json.dumps(
+                {
+                    "permissions": {
+                        "allow": ["Read(*)", "Bash(gh:*)"],
+                        "additionalDirectories": ["../docs"],
+                    }
+                }
+            )
+        )
+
+        installer._merge_settings_files(backup_settings, target_settings)
+
+        permissions = json.loads(target_settings.read_text())["permissions"]
+        assert permissions["allow"] == [
+            "Read(*)",
+            "Bash(gh:*)",
+            "Bash(git:*)",
+            "Bash(npm test)",
+        ]
+        assert permissions["deny"] == ["Bash(rm -rf /)"]
+        assert permissions["additionalDirectories"] == ["../docs", "../shared"]
 
     def test_setup_over_existing_preserves_user_content(self, temp_project):
         """Test that setup over existing installation preserves user content."""
@@ -357,84 +416,32 @@ class TestDataSafetyIntegration:
 # Helper methods
 def _create_realistic_user_content(claude_dir: Path) -> None:
     """Create realistic user content that should be preserved."""
-    # User PRDs
-    prds_dir = claude_dir / "prds"
-    prds_dir.mkdir(exist_ok=True)
-    (prds_dir / "feature_a.md").write_text(
-        """# Feature A PRD
+    for directory in {(claude_dir / rel).parent for rel, _ in _USER_CONTENT_SPEC}:
+        directory.mkdir(parents=True, exist_ok=True)
+    # Bytes keep the files identical on every platform and locale
+    for rel, content in _USER_CONTENT_SPEC:
+        (claude_dir / rel).write_bytes(content.encode("utf-8"))
 
-## Overview
-This is a user-created product requirements document.
-
-## Requirements
-- User requirement 1
-- User requirement 2
-"""
-    )
-    (prds_dir / "feature_b.md").write_text("# Feature B\nAnother user PRD")
 
-    # User epics
-    epics_dir = claude_dir / "epics"
-    epics_dir.mkdir(exist_ok=True)
-
-    epic1_dir = epics_dir / "epic1"
-    epic1_dir.mkdir()
-    (epic1_dir / "epic.md").write_text("# Epic 1\nUser-created epic")
-    (epic1_dir / "task_001.md").write_text("## Task 001\nUser task")
-
-    # User agents
-    agents_dir = claude_dir / "agents"
-    agents_dir.mkdir(exist_ok=True)
-    (agents_dir / "custom_analyzer.py").write_text(
-        '''"""Custom user agent."""
-
-def analyze_data(data):
-    """User-created analysis function."""
-    return {"result": "user analysis"}
-'''
-    )
-    (agents_dir / "user_helper.py").write_text("# User helper agent")
-
-    # User custom context
-    context_dir = claude_dir / "context"
-    context_dir.mkdir(exist_ok=True)
-    custom_dir = context_dir / "custom"
-    custom_dir.mkdir(exist_ok=True)
-    (custom_dir / "user_context.md").write_text("# User Context\nCustom user context")
+def _collect_files(root: Path) -> Set[str]:
+    """Return the forward-slash paths of every file below root."""
+    files = set()
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        files.update(prefix + name for name in filenames)
+    return files
 
 
 def _verify_user_content_preserved(claude_dir: Path) -> None:
     """Verify that all user content is preserved."""
-    # Check PRDs
-    prds_dir = claude_dir / "prds"
-    assert prds_dir.exists(), "PRDs directory was removed!"
-    assert (prds_dir / "feature_a.md").exists(), "User PRD was removed!"
-    assert (prds_dir / "feature_b.md").exists(), "User PRD was removed!"
-
-    # Verify content integrity
-    content = (prds_dir / "feature_a.md").read_text()
-    assert "user-created product requirements" in content.lower()
-
-    # Check epics
-    epics_dir = claude_dir / "epics"
-    assert epics_dir.exists(), "Epics directory was removed!"
-    assert (epics_dir / "epic1" / "epic.md").exists(), "User epic was removed!"
-    assert (epics_dir / "epic1" / "task_001.md").exists(), "User task was removed!"
-
-    # Check agents
-    agents_dir = claude_dir / "agents"
-    assert agents_dir.exists(), "Agents directory was removed!"
-    assert (agents_dir / "custom_analyzer.py").exists(), "User agent was removed!"
-    assert (agents_dir / "user_helper.py").exists(), "User agent was removed!"
-
-    # Verify agent content integrity
-    agent_content = (agents_dir / "custom_analyzer.py").read_text()
-    assert "User-created analysis function" in agent_content
-
-    # Check custom context
-    custom_dir = claude_dir / "context" / "custom"
-    assert custom_dir.exists(), "User custom context was removed!"
-    assert (custom_dir / "user_context.md").exists(), "User context file was removed!"
+    # One directory walk instead of a stat per expected file
+    present = _collect_files(claude_dir)
+    for rel, content in _USER_CONTENT_SPEC:
+        assert rel in present, f"User file {rel} was removed!"
+        # Verify content integrity
+        expected = content.encode("utf-8")
+        assert (claude_dir / rel).read_bytes() == expected, f"User file {rel} changed!"
 
 
 def _verify_ccpm_scaffolding_removed(claude_dir: Path) -> None:
@@ -455,38 +462,118 @@ def _verify_ccpm_scaffolding_removed(claude_dir: Path) -> None:
 
 
 @pytest.fixture
-def temp_project():
+def temp_project(tmp_path):
     """Create a temporary project directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _user_content_template(tmp_path_factory):
+    """Build the realistic user content tree once per session."""
+    template = tmp_path_factory.mktemp("user_content")
+    _create_realistic_user_content(template)
+    return template
 
 
 @pytest.fixture
-def temp_project_with_ccpm(temp_project):
-    """Create a temporary project with CCPM installed."""
-    # Initialize git
-    import subprocess
-
-    subprocess.run(["git", "init"], cwd=temp_project, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=temp_project, check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=temp_project,
-        check=True,
-    )
-
-    # Create installer and basic setup
+def user_content(_user_content_template):
+    """Return a callable that copies the realistic user content into a directory.
+
+    The files are copied, not linked, because tests change their metadata.
+    """
+
+    def materialize(claude_dir: Path) -> None:
+        shutil.copytree(_user_content_template, claude_dir, dirs_exist_ok=True)
+
+    return materialize
+
+
+@pytest.fixture(autouse=True)
+def _verify_user_content_on_teardown(request, temp_project):
+    """Check that user content survived every test that created it."""
+    yield
+    if "user_content" in request.fixturenames:
+        _verify_user_content_preserved(temp_project / ".claude")
+
+
+@pytest.fixture
+def installed_claude(temp_project):
+    """Create a .claude directory with a current tracking file.
+
+    Returns:
+        Tuple of the project's installer and its .claude directory
+    """
     installer = CCPMInstaller(temp_project)
     claude_dir = temp_project / ".claude"
     claude_dir.mkdir()
+    installer._create_tracking_file(had_existing=True)
+    return installer, claude_dir
+
+
+@pytest.fixture(params=["safe", "legacy_dangerous", "corrupted_json", "missing"])
+def tracking_variant(request, temp_project, monkeypatch):
+    """Return a callable that lays down one kind of tracking state.
+
+    safe is a current tracking file, legacy_dangerous an old one listing user
+    content directories, corrupted_json a partial install with an unreadable
+    tracking file, and missing CCPM-like files with no tracking file at all.
+    """
+    claude_dir = temp_project / ".claude"
+    tracking_file = temp_project / ".ccpm_tracking.json"
+
+    def write() -> None:
+        if request.param == "safe":
+            CCPMInstaller(temp_project)._create_tracking_file(had_existing=True)
+        elif request.param == "legacy_dangerous":
+            # Old format that listed user content for removal
+            legacy_tracking = {
+                "version": "0.1.0",
+                "installed_at": "2023-01-01T00:00:00",
+                "had_existing_claude": True,
+                "ccpm_files": [
+                    "scripts/pm",
+                    "commands/pm",
+                    "agents",  # DANGEROUS - user content
+                    "prds",  # DANGEROUS - user content
+                    "epics",  # DANGEROUS - user content
+                    "scripts/test-and-log.sh",
+                ],
+            }
+            tracking_file.write_text(jsonio.dumps(legacy_tracking), encoding="utf-8")
+        elif request.param == "corrupted_json":
+            (claude_dir / "settings.local.json").write_bytes(b'{"partial": true}')
+            tracking_file.write_bytes(b"invalid json content")
+        else:
+            (claude_dir / "settings.local.json").write_bytes(b'{"test": true}')
+            (claude_dir / "CLAUDE.md").write_bytes(b"# CLAUDE instructions")
+            (claude_dir / "scripts").mkdir()
+            (claude_dir / "scripts" / "test-and-log.sh").write_bytes(
+                b"#!/bin/bash\necho 'test'"
+            )
+            # Without tracking, uninstall asks before removing scaffolding
+            monkeypatch.setenv("CCPM_UNINSTALL_SCAFFOLDING", "y")
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def _ccpm_project_template(tmp_path_factory):
+    """Build the project with a tracked CCPM install once per session.
+
+    Uninstall only reads the tracking file and .claude/, so the project
+    needs no git repository.
+    """
+    template = tmp_path_factory.mktemp("ccpm_template")
 
     # Create tracking file to simulate installation
-    installer._create_tracking_file(had_existing=True)
+    (template / ".claude").mkdir()
+    CCPMInstaller(template)._create_tracking_file(had_existing=True)
 
-    return installer, temp_project
+    return template
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+@pytest.fixture
+def temp_project_with_ccpm(temp_project, _ccpm_project_template):
+    """Create a temporary project with CCPM installed."""
+    shutil.copytree(_ccpm_project_template, temp_project, dirs_exist_ok=True)
+    return CCPMInstaller(temp_project), temp_project
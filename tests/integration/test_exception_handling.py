@@ -5,6 +5,7 @@ and that error recovery mechanisms work correctly with real operations.
 """
 
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -20,20 +21,18 @@ from ccpm.utils.backup import BackupManager
 class TestExceptionChaining:
     """Test exception chain preservation with real execution."""
 
-    def test_timeout_exception_chaining_pm_command(
-        self, temp_project_with_git, monkeypatch
-    ):
+    def test_timeout_exception_chaining_pm_command(self, real_git_repo, monkeypatch):
         """Test that timeout exceptions preserve original context in PM commands."""
         from ccpm.commands.pm import invoke_claude_command
 
         # Enter temporary project directory for hermetic testing
-        monkeypatch.chdir(temp_project_with_git)
+        monkeypatch.chdir(real_git_repo)
 
         # Create a mock Claude CLI that will timeout
         if sys.platform == "win32":
             # On Windows, create a batch file that calls Python
-            mock_claude_script = temp_project_with_git / "mock_claude.bat"
-            python_script = temp_project_with_git / "mock_claude.py"
+            mock_claude_script = real_git_repo / "mock_claude.bat"
+            python_script = real_git_repo / "mock_claude.py"
             python_script.write_text(
                 """import time
 import sys
@@ -44,7 +43,7 @@ sys.exit(0)
             mock_claude_script.write_text(f'@echo off\npython "{python_script}"\n')
         else:
             # Unix-like systems
-            mock_claude_script = temp_project_with_git / "mock_claude.py"
+            mock_claude_script = real_git_repo / "mock_claude.py"
             mock_claude_script.write_text(
                 """#!/usr/bin/env python3
 import time
@@ -56,7 +55,7 @@ sys.exit(0)
             mock_claude_script.chmod(0o755)
 
         # Set up .claude directory
-        claude_dir = temp_project_with_git / ".claude"
+        claude_dir = real_git_repo / ".claude"
         claude_dir.mkdir(exist_ok=True)
 
         # Mock find_claude_cli to return our timeout script
@@ -75,19 +74,19 @@ sys.exit(0)
                 assert "operation too complex" in str(exc_info.value)
 
     def test_timeout_exception_chaining_maintenance_command(
-        self, temp_project_with_git, monkeypatch
+        self, real_git_repo, monkeypatch
     ):
         """Test timeout exceptions preserve original context in maintenance."""
         from ccpm.commands.maintenance import invoke_claude_command
 
         # Enter temporary project directory for hermetic testing
-        monkeypatch.chdir(temp_project_with_git)
+        monkeypatch.chdir(real_git_repo)
 
         # Create a mock Claude CLI that will timeout
         if sys.platform == "win32":
             # On Windows, create a batch file that calls Python
-            mock_claude_script = temp_project_with_git / "mock_claude.bat"
-            python_script = temp_project_with_git / "mock_claude.py"
+            mock_claude_script = real_git_repo / "mock_claude.bat"
+            python_script = real_git_repo / "mock_claude.py"
             python_script.write_text(
                 """import time
 import sys
@@ -98,7 +97,7 @@ sys.exit(0)
             mock_claude_script.write_text(f'@echo off\npython "{python_script}"\n')
         else:
             # Unix-like systems
-            mock_claude_script = temp_project_with_git / "mock_claude.py"
+            mock_claude_script = real_git_repo / "mock_claude.py"
             mock_claude_script.write_text(
                 """#!/usr/bin/env python3
 import time
@@ -110,7 +109,7 @@ sys.exit(0)
             mock_claude_script.chmod(0o755)
 
         # Set up .claude directory
-        claude_dir = temp_project_with_git / ".claude"
+        claude_dir = real_git_repo / ".claude"
         claude_dir.mkdir(exist_ok=True)
 
         # Mock find_claude_cli to return our timeout script
@@ -127,12 +126,12 @@ sys.exit(0)
                 assert isinstance(exc_info.value.__cause__, subprocess.TimeoutExpired)
                 assert "timeout" in str(exc_info.value).lower()
 
-    def test_claude_command_failure_exception_chaining(self, temp_project_with_git):
+    def test_claude_command_failure_exception_chaining(self, real_git_repo):
         """Test that command failures preserve original context."""
         from ccpm.commands.pm import invoke_claude_command
 
         # Create a mock Claude CLI that will fail
-        mock_claude_script = temp_project_with_git / "mock_claude_fail.py"
+        mock_claude_script = real_git_repo / "mock_claude_fail.py"
         mock_claude_script.write_text(
             """#!/usr/bin/env python3
 import sys
@@ -143,7 +142,7 @@ sys.exit(1)  # Non-zero exit
         mock_claude_script.chmod(0o755)
 
         # Set up .claude directory
-        claude_dir = temp_project_with_git / ".claude"
+        claude_dir = real_git_repo / ".claude"
         claude_dir.mkdir(exist_ok=True)
 
         # Mock find_claude_cli to return our failing script
@@ -185,6 +184,32 @@ sys.exit(1)  # Non-zero exit
         assert original_file.read_text() == "original content"
         assert not new_file.exists()
 
+    def test_fast_copy_refuses_same_file(self, temp_project):
+        """Test that copying a file onto itself raises without truncating it."""
+        from ccpm.utils.fastcopy import fast_copy
+
+        source = temp_project / "settings.json"
+        source.write_text('{"keep": true}')
+        link = temp_project / "settings_link.json"
+        os.link(source, link)
+
+        for target in (source, link):
+            with pytest.raises(shutil.SameFileError):
+                fast_copy(source, target)
+
+        assert source.read_text() == '{"keep": true}'
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Requires named pipes")
+    def test_fast_copy_refuses_named_pipe(self, temp_project):
+        """Test that a named pipe source raises instead of blocking."""
+        from ccpm.utils.fastcopy import fast_copy
+
+        fifo = temp_project / "pipe"
+        os.mkfifo(fifo)
+
+        with pytest.raises(shutil.SpecialFileError):
+            fast_copy(fifo, temp_project / "copy")
+
     def test_installer_update_error_recovery(self, temp_project):
         """Test that installer update properly recovers from errors."""
         installer = CCPMInstaller(temp_project)
@@ -217,17 +242,64 @@ sys.exit(1)  # Non-zero exit
             assert original_file.exists()
             assert original_file.read_text() == "original"
 
+    def test_retry_rmdir_recovers_from_busy_directory(self, temp_project):
+        """Test that rmdir is retried while the directory is still busy."""
+        busy_dir = temp_project / "busy"
+        busy_dir.mkdir()
+
+        real_rmdir = os.rmdir
+        attempts = []
+
+        def flaky_rmdir(path):
+            attempts.append(path)
+            if len(attempts) < 3:
+                raise PermissionError("directory in use")
+            real_rmdir(path)
+
+        with patch("ccpm.core.installer.os.rmdir", side_effect=flaky_rmdir):
+            CCPMInstaller._retry_rmdir(busy_dir)
+
+        assert len(attempts) == 3
+        assert not busy_dir.exists()
+
+    def test_retry_rmdir_raises_when_never_released(self, temp_project):
+        """Test that rmdir errors surface once all retries are exhausted."""
+        busy_dir = temp_project / "busy"
+        busy_dir.mkdir()
+
+        with patch(
+            "ccpm.core.installer.os.rmdir",
+            side_effect=PermissionError("directory in use"),
+        ):
+            with pytest.raises(PermissionError):
+                CCPMInstaller._retry_rmdir(busy_dir)
+
+        assert busy_dir.exists()
+
+    def test_retry_rmdir_raises_other_errors_immediately(self, temp_project):
+        """Test that errors waiting cannot fix are raised without retrying."""
+        full_dir = temp_project / "full"
+        full_dir.mkdir()
+        (full_dir / "keep.txt").write_text("user data")
+
+        with patch("ccpm.core.installer.time.sleep") as mock_sleep:
+            with pytest.raises(OSError) as exc_info:
+                CCPMInstaller._retry_rmdir(full_dir)
+
+        assert not isinstance(exc_info.value, PermissionError)
+        mock_sleep.assert_not_called()
+        assert (full_dir / "keep.txt").exists()
+
 
 class TestShellErrorHandling:
     """Test shell command error handling with real execution."""
 
-    def test_pm_script_timeout_handling(self, temp_project_with_claude):
+    def test_pm_script_timeout_handling(self, project_with_claude):
         """Test PM script timeout handling with real execution."""
         from ccpm.utils.shell import run_pm_script
 
         # Create a script that will timeout
-        scripts_dir = temp_project_with_claude / ".claude" / "scripts" / "pm"
-        scripts_dir.mkdir(parents=True, exist_ok=True)
+        scripts_dir = project_with_claude / ".claude" / "scripts" / "pm"
 
         timeout_script = scripts_dir / "timeout_test.sh"
         timeout_script.write_text(
@@ -240,7 +312,7 @@ echo "This should not appear"
 
         # Run with very short timeout
         rc, stdout, stderr = run_pm_script(
-            "timeout_test", cwd=temp_project_with_claude, timeout=2
+            "timeout_test", cwd=project_with_claude, timeout=2
         )
 
         # Should timeout
@@ -248,13 +320,12 @@ echo "This should not appear"
         assert "timed out" in stderr.lower()
         assert "timeout_test" in stderr
 
-    def test_pm_script_missing_shell_handling(self, temp_project_with_claude):
+    def test_pm_script_missing_shell_handling(self, project_with_claude):
         """Test PM script handling when no shell is available."""
         from ccpm.utils.shell import run_pm_script
 
         # Create a test script
-        scripts_dir = temp_project_with_claude / ".claude" / "scripts" / "pm"
-        scripts_dir.mkdir(parents=True, exist_ok=True)
+        scripts_dir = project_with_claude / ".claude" / "scripts" / "pm"
 
         test_script = scripts_dir / "test.sh"
         test_script.write_text(
@@ -273,18 +344,18 @@ echo "Hello from test"
                 "shell_type": None,
             }
 
-            rc, stdout, stderr = run_pm_script("test", cwd=temp_project_with_claude)
+            rc, stdout, stderr = run_pm_script("test", cwd=project_with_claude)
 
             assert rc == 1
             assert "No compatible shell found" in stderr
             assert "install Git for Windows, WSL, or MSYS2" in stderr
 
-    def test_cross_platform_error_messages(self, temp_project_with_claude):
+    def test_cross_platform_error_messages(self, project_with_claude):
         """Test that cross-platform error messages are informative."""
         from ccpm.utils.shell import run_pm_script
 
         # Test with non-existent script
-        rc, stdout, stderr = run_pm_script("nonexistent", cwd=temp_project_with_claude)
+        rc, stdout, stderr = run_pm_script("nonexistent", cwd=project_with_claude)
 
         assert rc == 1
         assert "Script not found" in stderr
@@ -298,28 +369,5 @@ def temp_project():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def temp_project_with_git(temp_project):
-    """Create a temporary project with git initialized."""
-    subprocess.run(["git", "init"], cwd=temp_project, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=temp_project, check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=temp_project,
-        check=True,
-    )
-    return temp_project
-
-
-@pytest.fixture
-def temp_project_with_claude(temp_project_with_git):
-    """Create a temporary project with .claude directory."""
-    claude_dir = temp_project_with_git / ".claude"
-    claude_dir.mkdir()
-    return temp_project_with_git
-
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
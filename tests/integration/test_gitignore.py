@@ -4,6 +4,7 @@ These tests verify that .gitignore properly excludes build artifacts
 from version control using real git operations and file creation.
 """
 
+import os
 import shutil
 import subprocess
 import tempfile
@@ -12,6 +13,8 @@ from typing import List
 
 import pytest
 
+from ccpm.core.installer import CCPMInstaller
+
 
 class TestGitignoreEffectiveness:
     """Test .gitignore with real git operations and build artifacts."""
@@ -410,3 +413,38 @@ ccpm = ccpm.cli:cli
         assert (
             len(appearing_artifacts) == 0
         ), f"Build artifacts not properly ignored: {appearing_artifacts}"
+
+
+class TestGitignoreUpdate:
+    """Test how setup adds CCPM entries to an existing .gitignore."""
+
+    def test_gitignore_update_is_idempotent(self, tmp_path):
+        """Test that .gitignore entries are added once and not rewritten."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n.ccpm_backup/\n")
+
+        installer = CCPMInstaller(tmp_path)
+        installer._update_gitignore()
+
+        lines = gitignore.read_text().splitlines()
+        assert lines[:2] == ["node_modules/", ".ccpm_backup/"]
+        assert lines.count(".ccpm_backup/") == 1
+        assert ".ccpm_tracking.json" in lines
+
+        # A second run finds nothing missing and leaves the file alone
+        os.utime(gitignore, (1_600_000_000, 1_600_000_000))
+        installer._update_gitignore()
+        assert gitignore.read_text().splitlines() == lines
+        assert gitignore.stat().st_mtime == 1_600_000_000
+
+    def test_gitignore_update_appends_after_unterminated_line(self, tmp_path):
+        """Test that appended entries never join the file's last line."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.pyc\ndist/")
+
+        CCPMInstaller(tmp_path)._update_gitignore()
+
+        assert gitignore.read_text() == (
+            "*.pyc\ndist/\n.ccpm_tracking.json\n.ccpm_backup/\n"
+            ".claude/epics/\n.claude/prds/\n"
+        )
@@ -0,0 +1,37 @@
+"""Integration tests for the JSON helpers and their optional backends."""
+
+import json
+from unittest.mock import patch
+
+from ccpm.utils import jsonio
+
+
+class TestJsonHelpers:
+    """Test that the fast backends behave like the stdlib fallback."""
+
+    def test_json_helpers_match_across_backends(self):
+        """Test that orjson and stdlib json produce identical files."""
+        data = {"version": "1.0", "files": ["a.md", "é.md"], "nested": {"n": 1}}
+        fast = jsonio.dumps(data)
+        with patch.object(jsonio, "orjson", None):
+            fallback = jsonio.dumps(data)
+            assert jsonio.loads(fast) == data
+
+        assert fast == fallback
+        assert jsonio.loads(fallback.encode()) == data
+
+    def test_load_member_reads_only_requested_key(self, tmp_path):
+        """Test that a single member is read with and without ijson."""
+        settings = tmp_path / "settings.json"
+        settings.write_text(
+            json.dumps({"model": "x", "permissions": {"allow": ["Read(*)"]}})
+        )
+
+        for backend in (jsonio.ijson, None):
+            with patch.object(jsonio, "ijson", backend):
+                with open(settings, "rb") as f:
+                    assert jsonio.load_member(f, "permissions") == {
+                        "allow": ["Read(*)"]
+                    }
+                with open(settings, "rb") as f:
+                    assert jsonio.load_member(f, "hooks", {}) == {}
@@ -0,0 +1,87 @@
+"""Integration tests for directory merging with real files."""
+
+import os
+import shutil
+import stat
+from pathlib import Path
+
+import pytest
+
+from ccpm.core.merger import DirectoryMerger
+
+
+class TestDirectoryMerger:
+    """Test merge decisions and copies into a real .claude directory."""
+
+    def test_merge_patterns_match_case_sensitively(self, tmp_path):
+        """Test that merge patterns follow fnmatchcase semantics."""
+        merger = DirectoryMerger()
+        target = tmp_path / ".claude"
+
+        assert merger._should_copy_file(
+            Path("agents/code-analyzer.md"), target / "agents/code-analyzer.md", True
+        ) == (True, False)
+        assert merger._should_copy_file(
+            Path("scripts/pm/status.sh"), target / "scripts/pm/status.sh", True
+        ) == (True, False)
+
+        # Preserved files are only copied when missing
+        (target / "context").mkdir(parents=True)
+        (target / "context" / "notes.md").write_text("# Notes")
+        assert merger._should_copy_file(
+            Path("context/notes.md"), target / "context/notes.md", True
+        ) == (False, True)
+
+        # Case differences do not match, so the existing file is kept
+        (target / "Agents").mkdir()
+        (target / "Agents" / "mine.MD").write_text("# Mine")
+        assert merger._should_copy_file(
+            Path("Agents/mine.MD"), target / "Agents/mine.MD", True
+        ) == (False, True)
+
+    def test_merge_report_distinguishes_added_and_updated(
+        self, tmp_path, mock_ccpm_repo, capsys
+    ):
+        """Test that the merge summary reflects the target before copying."""
+        claude_dir = tmp_path / ".claude"
+        (claude_dir / "scripts" / "pm").mkdir(parents=True)
+        (claude_dir / "scripts" / "pm" / "init.sh").write_text("echo 'old init'")
+
+        merger = DirectoryMerger()
+        merger.merge_directories(mock_ccpm_repo / ".claude", claude_dir, True)
+
+        report = capsys.readouterr().out.splitlines()
+        assert f"  Updated: {Path('scripts/pm/init.sh')}" in report
+        assert f"  Added: {Path('scripts/pm/help.sh')}" in report
+
+    def test_merge_skips_identical_overwrite_files(self, tmp_path, mock_ccpm_repo):
+        """Test that unchanged CCPM files are not rewritten on update."""
+        source = mock_ccpm_repo / ".claude"
+        claude_dir = tmp_path / ".claude"
+        (claude_dir / "scripts" / "pm").mkdir(parents=True)
+        same = claude_dir / "scripts" / "pm" / "help.sh"
+        shutil.copy2(source / "scripts" / "pm" / "help.sh", same)
+        changed = claude_dir / "scripts" / "pm" / "init.sh"
+        changed.write_text("echo 'old init'")
+        os.utime(same, (1_600_000_000, 1_600_000_000))
+
+        DirectoryMerger().merge_directories(source, claude_dir, True)
+
+        assert same.stat().st_mtime == 1_600_000_000
+        assert changed.read_text() == "#!/bin/bash\necho 'Initialized'"
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_merge_restores_lost_exec_bit(self, tmp_path, mock_ccpm_repo):
+        """Test that an identical script missing its exec bit is copied again."""
+        source = mock_ccpm_repo / ".claude"
+        source_script = source / "scripts" / "pm" / "help.sh"
+        source_script.chmod(0o755)
+        claude_dir = tmp_path / ".claude"
+        (claude_dir / "scripts" / "pm").mkdir(parents=True)
+        script = claude_dir / "scripts" / "pm" / "help.sh"
+        shutil.copy2(source_script, script)
+        script.chmod(0o644)
+
+        DirectoryMerger().merge_directories(source, claude_dir, True)
+
+        assert stat.S_IMODE(script.stat().st_mode) == 0o755
@@ -195,6 +195,7 @@ class TestTimeoutConfiguration:
             os.environ,
             {"CCPM_TIMEOUT_PM_SCRIPT": "600", "CCPM_TIMEOUT_GIT_COMMAND": "120"},
         ):
+            get_timeout_for_operation.cache_clear()
             assert get_timeout_for_operation("pm_script", 300) == 600
             assert get_timeout_for_operation("git_command", 60) == 120
 
@@ -206,6 +207,7 @@ class TestTimeoutConfiguration:
                 "CCPM_TIMEOUT_GIT_COMMAND": "not_a_number",
             },
         ):
+            get_timeout_for_operation.cache_clear()
             assert get_timeout_for_operation("pm_script", 300) == 300
             assert get_timeout_for_operation("git_command", 60) == 60
 
@@ -41,6 +41,7 @@ def clean_temp_env() -> Tuple[Path, Path]:
         yield temp_path, venv_path
 
 
+@pytest.mark.slow
 class TestPackagingOperations:
     """Test real packaging operations with actual pip and build tools."""
 
@@ -622,6 +623,7 @@ class TestPackagingOperations:
         assert "All imports successful" in result.stdout
 
 
+@pytest.mark.slow
 class TestRealWorldScenarios:
     """Test scenarios that users would encounter in production."""
 
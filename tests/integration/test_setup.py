@@ -127,6 +127,31 @@ class TestSetupCommand:
         # Verify .claude created
         assert (test_dir / ".claude").exists()
 
+    def test_setup_clones_template_while_installing_extensions(
+        self, real_git_repo: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test the repository fallback when no bundled template is packaged."""
+        import ccpm
+        from ccpm.core.installer import CCPMInstaller
+
+        # Point the package at a directory without claude_template
+        monkeypatch.setattr(ccpm, "__file__", str(tmp_path / "pkg" / "__init__.py"))
+
+        def fake_clone(self, dest: Path) -> None:
+            (dest / ".claude" / "agents").mkdir(parents=True)
+            (dest / ".claude" / "agents" / "agent.md").write_text("# Agent")
+
+        monkeypatch.setattr(CCPMInstaller, "_clone_ccpm_repo", fake_clone)
+        installer = CCPMInstaller(real_git_repo)
+        monkeypatch.setattr(installer.gh_cli, "ensure_gh_installed", lambda: True)
+        monkeypatch.setattr(installer.gh_cli, "setup_auth", lambda: True)
+        monkeypatch.setattr(installer.gh_cli, "install_extensions", lambda: None)
+
+        installer.setup()
+
+        agent = real_git_repo / ".claude" / "agents" / "agent.md"
+        assert agent.read_text() == "# Agent"
+
 
 class TestUpdateCommand:
     """Test the ccpm update command."""
@@ -182,6 +207,41 @@ class TestUpdateCommand:
             or "No CCPM installation found" in result.stdout
         )
 
+    def test_update_clone_checks_out_only_claude(self, tmp_path: Path):
+        """Test that the update clone only checks out the .claude tree."""
+        from ccpm.core.installer import CCPMInstaller
+
+        source = tmp_path / "source"
+        (source / ".claude" / "agents").mkdir(parents=True)
+        (source / ".claude" / "agents" / "agent.md").write_text("# Agent")
+        (source / "docs").mkdir()
+        (source / "docs" / "guide.md").write_text("# Guide")
+        subprocess.run(["git", "init"], cwd=source, check=True, capture_output=True)
+        subprocess.run(["git", "add", "-A"], cwd=source, check=True)
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "user.name=Test User",
+                "-c",
+                "user.email=test@example.com",
+                "commit",
+                "-m",
+                "Initial",
+            ],
+            cwd=source,
+            check=True,
+            capture_output=True,
+        )
+
+        installer = CCPMInstaller(tmp_path)
+        installer.CCPM_REPO = source.as_uri()
+        dest = tmp_path / "clone"
+        installer._clone_ccpm_repo(dest)
+
+        assert (dest / ".claude" / "agents" / "agent.md").read_text() == "# Agent"
+        assert not (dest / "docs").exists()
+
 
 class TestUninstallCommand:
     """Test the ccpm uninstall command."""